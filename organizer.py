@@ -16,16 +16,40 @@ Categories:
 from __future__ import annotations
 
 import argparse
+import errno
+import functools
 import json
+import os
+import re
 import shutil
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
+try:
+    import orjson
 
-@dataclass
+    HAS_ORJSON = True
+except ImportError:  # optional: faster --json output
+    HAS_ORJSON = False
+
+from linux_optimized import StatxResult, statx, statx_available
+
+# Generic names (like IMG_1234, screenshot) that get a dated name instead
+_GENERIC_NAME_RE = re.compile(r"(?i)(?:img_|image_|screenshot|screen shot|untitled)")
+
+
+@functools.lru_cache(maxsize=256)
+def _month_bucket(year: int, month: int) -> str:
+    """Return the YYYY-MM folder name for a month."""
+    return f"{year:04d}-{month:02d}"
+
+
+@dataclass(slots=True)
 class FileInfo:
     """Information about a file to be organized."""
 
@@ -41,14 +65,10 @@ class FileInfo:
 
     def _generate_suggested_name(self) -> str:
         """Generate a descriptive name based on content or date."""
-        timestamp = self.created_date.strftime("%Y%m%d_%H%M%S")
-        original_name = self.source_path.stem
-        extension = self.source_path.suffix
-
         # If name is generic (like IMG_1234, screenshot), add date
-        generic_prefixes = ("img_", "image_", "screenshot", "screen shot", "untitled")
-        if any(original_name.lower().startswith(p) for p in generic_prefixes):
-            return f"{self.category}_{timestamp}{extension}"
+        if _GENERIC_NAME_RE.match(self.source_path.name):
+            timestamp = self.created_date.strftime("%Y%m%d_%H%M%S")
+            return f"{self.category}_{timestamp}{self.source_path.suffix}"
 
         return self.source_path.name
 
@@ -78,6 +98,9 @@ class OrganizeResult:
         return len(self.errors) == 0
 
 
+DEFAULT_STAT_THREADS = min(32, (os.cpu_count() or 1) * 4)
+
+
 class FileOrganizer:
     """Organizes files by category and date."""
 
@@ -109,6 +132,11 @@ class FileOrganizer:
         "Videos": (".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v"),
         "Audio": (".mp3", ".wav", ".aac", ".flac", ".m4a", ".ogg"),
     }
+    # Flattened once at class creation; lookups are a single dict probe
+    _EXT_TO_CATEGORY: dict[str, str] = {
+        ext: category for category, extensions in CATEGORIES.items() for ext in extensions
+    }
+    _CATEGORY_NAMES = frozenset(CATEGORIES) | {"Misc"}
 
     def __init__(
         self,
@@ -116,140 +144,240 @@ class FileOrganizer:
         dry_run: bool = True,
         organize_by_date: bool = True,
         progress_callback: Callable[[int, int, str], None] | None = None,
+        stat_threads: int = DEFAULT_STAT_THREADS,
     ) -> None:
         self.source_folder = Path(source_folder).expanduser().resolve()
+        # Per-file path work uses plain strings; Path is only built at the edges
+        self._source_str = str(self.source_folder)
+        self._source_sep = os.path.join(self._source_str, "")
         self.dry_run = dry_run
         self.organize_by_date = organize_by_date
         self.progress_callback = progress_callback
+        self.stat_threads = stat_threads
         self.result = OrganizeResult()
+        self._claimed_targets: set[str] = set()
+        self._known_dirs: dict[str, bool] = {}
+        self._created_dirs: set[Path] = set()
 
         if not self.source_folder.exists():
             raise ValueError(f"Source folder does not exist: {source_folder}")
         if not self.source_folder.is_dir():
             raise ValueError(f"Source path is not a directory: {source_folder}")
+        if stat_threads < 1:
+            raise ValueError(f"stat_threads must be at least 1, got {stat_threads}")
 
-    def _get_category(self, file_path: Path) -> str:
+    def _get_category(self, file_path: Path | os.DirEntry) -> str:
         """Determine file category based on extension."""
-        extension = file_path.suffix.lower()
-
-        for category, extensions in self.CATEGORIES.items():
-            if extension in extensions:
-                return category
+        extension = os.path.splitext(file_path.name)[1].lower()
+        return self._EXT_TO_CATEGORY.get(extension, "Misc")
 
-        return "Misc"
+    def _get_creation_date(self, stat_result: os.stat_result | StatxResult) -> datetime:
+        """Get file creation date, falling back to modification date.
 
-    def _get_creation_date(self, file_path: Path) -> datetime:
-        """Get file creation date, falling back to modification date."""
-        stat = file_path.stat()
-
-        # Try creation time first (macOS), fall back to modification time
-        try:
-            timestamp = stat.st_birthtime
-        except AttributeError:
-            timestamp = stat.st_mtime
+        Birth time comes from os.stat on macOS and from statx() on Linux.
+        Without statx (old kernels or glibc) Linux has no birth time, so the
+        same file can land in a different month folder than it would with
+        statx: the fallback buckets by modification time.
+        """
+        timestamp = getattr(stat_result, "st_birthtime", None) or stat_result.st_mtime
 
         return datetime.fromtimestamp(timestamp)
 
+    def _target_dir(self, category: str, month_bucket: str) -> str:
+        """Folder a file of this category and month belongs in, as a string."""
+        if self.organize_by_date:
+            return os.path.join(self._source_str, category, month_bucket)
+        return os.path.join(self._source_str, category)
+
     def _generate_target_path(self, file_info: FileInfo) -> Path:
         """Generate target path for organized file."""
-        if self.organize_by_date:
-            date_folder = file_info.created_date.strftime("%Y-%m")
-            target = (
-                self.source_folder
-                / file_info.category
-                / date_folder
-                / file_info.suggested_name
-            )
-        else:
-            target = self.source_folder / file_info.category / file_info.suggested_name
+        created = file_info.created_date
+        target_dir = self._target_dir(
+            file_info.category, _month_bucket(created.year, created.month)
+        )
+        name = file_info.suggested_name
+        target = os.path.join(target_dir, name)
+        source = str(file_info.source_path)
 
         # Handle duplicates
         counter = 1
-        original_target = target
-        while target.exists() and target != file_info.source_path:
-            stem = original_target.stem
-            suffix = original_target.suffix
-            target = original_target.with_name(f"{stem}_{counter}{suffix}")
+        stem, suffix = os.path.splitext(name)
+        while target != source and self._is_target_taken(target, target_dir):
+            target = os.path.join(target_dir, f"{stem}_{counter}{suffix}")
             counter += 1
 
-        return target
+        self._claimed_targets.add(target)
+        return Path(target)
+
+    def _is_target_taken(self, target: str, target_dir: str) -> bool:
+        """Check whether target is claimed by this run or already on disk."""
+        if target in self._claimed_targets:
+            return True
+
+        # Only probe files in folders that existed before this run
+        dir_exists = self._known_dirs.get(target_dir)
+        if dir_exists is None:
+            dir_exists = self._known_dirs[target_dir] = os.path.isdir(target_dir)
+        return dir_exists and os.path.exists(target)
 
     def _report_progress(self, current: int, total: int, status: str) -> None:
         """Report progress if callback is set."""
         if self.progress_callback:
             self.progress_callback(current, total, status)
 
+    def _scandir_recursive(self, path: str) -> Iterator[os.DirEntry]:
+        """Yield non-directory entries below path, pruning hidden and category folders.
+
+        Folders that can't be listed are recorded as errors and skipped so
+        one unreadable subfolder doesn't abort the whole scan.
+        """
+        try:
+            it = os.scandir(path)
+        except OSError as e:
+            self.result.errors.append((Path(path), str(e)))
+            return
+        with it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError as e:
+                    self.result.errors.append((Path(entry.path), str(e)))
+                    continue
+                if is_dir:
+                    if entry.name not in self._CATEGORY_NAMES:
+                        yield from self._scandir_recursive(entry.path)
+                else:
+                    yield entry
+
+    @staticmethod
+    def _stat_entry(entry: os.DirEntry) -> os.stat_result | StatxResult | OSError:
+        """Stat a directory entry without following symlinks.
+
+        Errors are returned rather than raised so one unreadable entry
+        doesn't abort the whole thread-pool map.
+        """
+        try:
+            if statx_available():
+                return statx(entry.path)
+            return entry.stat(follow_symlinks=False)
+        except OSError as e:
+            return e
+
+    def _scan_iter(self) -> Iterator[FileInfo]:
+        """Yield categorized files that need organizing, one at a time."""
+        # Get all files (excluding hidden files and our category folders)
+        all_entries = list(self._scandir_recursive(self._source_str))
+
+        total = len(all_entries)
+
+        # Stat calls are latency-bound and release the GIL, so overlap them
+        with ThreadPoolExecutor(max_workers=self.stat_threads) as executor:
+            stat_results = executor.map(self._stat_entry, all_entries)
+
+            for idx, (entry, st) in enumerate(zip(all_entries, stat_results)):
+                self._report_progress(idx, total, f"Scanning: {entry.name}")
+
+                if isinstance(st, OSError):
+                    self.result.errors.append((Path(entry.path), str(st)))
+                    continue
+                # Only regular files; symlinks, sockets, FIFOs etc. stay put
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+
+                category = self._get_category(entry)
+                created_date = self._get_creation_date(st)
+                file_path = Path(entry.path)
+
+                file_info = FileInfo(
+                    source_path=file_path,
+                    category=category,
+                    created_date=created_date,
+                )
+                file_info.target_path = self._generate_target_path(file_info)
+                yield file_info
+
     def scan_files(self) -> list[FileInfo]:
         """Scan source folder and categorize all files."""
-        files: list[FileInfo] = []
+        return list(self._scan_iter())
 
-        # Get all files (excluding hidden files and our category folders)
-        category_names = set(self.CATEGORIES.keys()) | {"Misc"}
-        all_paths = [
-            p
-            for p in self.source_folder.rglob("*")
-            if p.is_file()
-            and not p.name.startswith(".")
-            and not any(cat in p.parts for cat in category_names)
-        ]
-
-        total = len(all_paths)
-        for idx, file_path in enumerate(all_paths):
-            self._report_progress(idx, total, f"Scanning: {file_path.name}")
-
-            category = self._get_category(file_path)
-            created_date = self._get_creation_date(file_path)
-
-            file_info = FileInfo(
-                source_path=file_path,
-                category=category,
-                created_date=created_date,
-            )
-            file_info.target_path = self._generate_target_path(file_info)
-
-            # Skip if already in correct location
-            if file_info.target_path == file_path:
-                self.result.skipped.append(file_path)
-            else:
-                files.append(file_info)
+    @staticmethod
+    def _move_file(source: Path, target: Path) -> None:
+        """Move a file, using a plain rename unless it crosses filesystems."""
+        try:
+            os.replace(source, target)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(source, target)
+
+    def _organize_file(self, file_info: FileInfo) -> None:
+        """Move a single file to its target path (or record it on dry runs)."""
+        if self.dry_run:
+            self.result.organized.append(file_info)
+            return
+
+        try:
+            # Create target directory (once per folder, not once per file)
+            if file_info.target_path:
+                target_dir = file_info.target_path.parent
+                if target_dir not in self._created_dirs:
+                    target_dir.mkdir(parents=True, exist_ok=True)
+                    self._created_dirs.add(target_dir)
+
+                self._move_file(file_info.source_path, file_info.target_path)
+                self.result.organized.append(file_info)
+
+        except (OSError, shutil.Error) as e:
+            self.result.errors.append((file_info.source_path, str(e)))
 
-        return files
+    @staticmethod
+    def _destination_key(file_info: FileInfo) -> tuple[str, str]:
+        """Sort key grouping files by category and target folder."""
+        target_dir = file_info.target_path.parent.as_posix() if file_info.target_path else ""
+        return (file_info.category, target_dir)
 
     def organize(self, files: list[FileInfo]) -> OrganizeResult:
         """Organize files into categorized folders."""
         total = len(files)
 
-        for idx, file_info in enumerate(files):
-            self._report_progress(idx, total, f"Organizing: {file_info.source_path.name}")
+        # Process files grouped by destination folder so each folder's
+        # directory entries stay hot in the kernel cache between moves
+        ordered = sorted(files, key=self._destination_key)
 
-            if self.dry_run:
-                self.result.organized.append(file_info)
-                continue
+        for idx, file_info in enumerate(ordered):
+            self._report_progress(idx, total, f"Organizing: {file_info.source_path.name}")
+            self._organize_file(file_info)
 
-            try:
-                # Create target directory
-                if file_info.target_path:
-                    file_info.target_path.parent.mkdir(parents=True, exist_ok=True)
+        self._report_progress(total, total, "Complete")
+        return self.result
 
-                    # Move file
-                    shutil.move(str(file_info.source_path), str(file_info.target_path))
-                    self.result.organized.append(file_info)
+    def scan_and_organize(self) -> OrganizeResult:
+        """Scan and organize in a single pass without building a file list.
 
-            except (OSError, shutil.Error) as e:
-                self.result.errors.append((file_info.source_path, str(e)))
+        Each file is moved as soon as it is scanned, so an interrupted run
+        keeps the moves made so far.
+        """
+        for file_info in self._scan_iter():
+            self._organize_file(file_info)
 
-        self._report_progress(total, total, "Complete")
+        self._report_progress(
+            self.result.success_count, self.result.success_count, "Complete"
+        )
         return self.result
 
     def generate_report(self) -> dict:
         """Generate organization report."""
         by_category: dict[str, int] = {}
+        # Plain string slicing is much cheaper than Path.relative_to per file
+        source_prefix = self._source_sep
         for file_info in self.result.organized:
             by_category[file_info.category] = by_category.get(file_info.category, 0) + 1
 
         return {
             "mode": "DRY RUN" if self.dry_run else "LIVE",
-            "source_folder": str(self.source_folder),
+            "source_folder": self._source_str,
             "total_files_scanned": len(self.result.organized)
             + len(self.result.skipped)
             + len(self.result.errors),
@@ -259,8 +387,8 @@ class FileOrganizer:
             "by_category": by_category,
             "organized_files": [
                 {
-                    "original": str(f.source_path.relative_to(self.source_folder)),
-                    "new": str(f.target_path.relative_to(self.source_folder))
+                    "original": str(f.source_path).removeprefix(source_prefix),
+                    "new": str(f.target_path).removeprefix(source_prefix)
                     if f.target_path
                     else None,
                     "category": f.category,
@@ -270,6 +398,19 @@ class FileOrganizer:
         }
 
 
+def dump_report(report: dict) -> bytes:
+    """Serialize a report to indented UTF-8 JSON, using orjson if installed."""
+    # All report values are already plain str/int/dict/list, so no default=
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(report, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # Non-UTF-8 file names arrive as surrogate escapes, which orjson
+            # rejects; the stdlib encoder below writes them as \u escapes
+            pass
+    return json.dumps(report, indent=2).encode()
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -294,6 +435,13 @@ def main() -> int:
         action="store_true",
         help="Output JSON report",
     )
+    parser.add_argument(
+        "--stat-threads",
+        type=int,
+        default=DEFAULT_STAT_THREADS,
+        metavar="N",
+        help=f"Parallel stat() calls while scanning (default: {DEFAULT_STAT_THREADS})",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -313,6 +461,7 @@ def main() -> int:
             dry_run=not args.apply,
             organize_by_date=not args.no_date_folders,
             progress_callback=progress,
+            stat_threads=args.stat_threads,
         )
 
         print(f"📁 Scanning: {organizer.source_folder}")
@@ -327,7 +476,8 @@ def main() -> int:
             report = organizer.generate_report()
 
             if args.json:
-                print(json.dumps(report, indent=2, default=str))
+                sys.stdout.flush()
+                sys.stdout.buffer.write(dump_report(report) + b"\n")
             else:
                 print(f"\n{'=' * 50}")
                 print(f"📊 Organization Report")
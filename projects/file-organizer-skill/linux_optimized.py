@@ -0,0 +1,145 @@
+"""Linux-specific fast paths for the file organizer.
+
+Wraps the statx(2) system call through ctypes so the scan loop can ask the
+kernel for only the fields it uses (file type, inode, size, modification
+time and birth time) and skip filesystem synchronisation on network mounts. Also exposes
+the birth time, which os.stat does not report on Linux.
+
+Falls back cleanly: statx_available() is False on non-Linux platforms,
+on glibc builds without the statx wrapper (< 2.28) and on kernels older
+than 4.11, in which case callers should use os.stat instead.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import functools
+import os
+import sys
+from typing import Callable, NamedTuple
+
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_DONT_SYNC = 0x4000
+
+STATX_TYPE = 0x0001
+STATX_MTIME = 0x0040
+STATX_INO = 0x0100
+STATX_SIZE = 0x0200
+STATX_BTIME = 0x0800
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """Mirror of ``struct statx`` from <linux/stat.h> (256 bytes)."""
+
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("_spare", ctypes.c_uint64 * 16),
+    ]
+
+
+class StatxResult(NamedTuple):
+    """Subset of stat fields returned by statx(), named like os.stat_result."""
+
+    st_mode: int
+    st_ino: int
+    st_size: int
+    st_mtime: float
+    st_mtime_ns: int
+    st_birthtime: float | None
+
+
+@functools.cache
+def _load_statx() -> Callable | None:
+    """Return libc's statx function, or None if it is not exported."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+
+    func = getattr(libc, "statx", None)
+    if func is None:
+        return None
+    func.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_uint,
+        ctypes.POINTER(_Statx),
+    ]
+    func.restype = ctypes.c_int
+    return func
+
+
+@functools.cache
+def statx_available() -> bool:
+    """Check once whether statx() works on this system."""
+    if _load_statx() is None:
+        return False
+    try:
+        statx(os.sep)
+    except OSError:
+        return False
+    return True
+
+
+def statx(path: str | os.PathLike) -> StatxResult:
+    """Stat path (without following symlinks) via statx().
+
+    Raises:
+        OSError: If the call fails, with errno set from the kernel
+    """
+    func = _load_statx()
+    if func is None:
+        raise OSError("statx() is not available on this platform")
+
+    buf = _Statx()
+    encoded = os.fsencode(path)
+    if func(
+        AT_FDCWD,
+        encoded,
+        AT_SYMLINK_NOFOLLOW | AT_STATX_DONT_SYNC,
+        STATX_TYPE | STATX_INO | STATX_SIZE | STATX_MTIME | STATX_BTIME,
+        ctypes.byref(buf),
+    ) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), os.fsdecode(encoded))
+
+    mtime = buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec / 1e9
+    birthtime = None
+    if buf.stx_mask & STATX_BTIME:
+        birthtime = buf.stx_btime.tv_sec + buf.stx_btime.tv_nsec / 1e9
+    return StatxResult(
+        st_mode=buf.stx_mode,
+        st_ino=buf.stx_ino,
+        st_size=buf.stx_size,
+        st_mtime=mtime,
+        st_mtime_ns=buf.stx_mtime.tv_sec * 1_000_000_000 + buf.stx_mtime.tv_nsec,
+        st_birthtime=birthtime,
+    )
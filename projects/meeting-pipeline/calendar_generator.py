@@ -23,25 +23,71 @@ Usage:
 
 from __future__ import annotations
 
-import uuid
+import io
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from email.utils import formataddr
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 # Default timezone for the organization
 DEFAULT_TIMEZONE = "Asia/Kolkata"
 DEFAULT_ORGANIZER_NAME = "Meeting Pipeline"
 DEFAULT_ORGANIZER_EMAIL = "meetings@company.com"
 
+UTC = timezone.utc
+
+# RFC 5545 TEXT escaping, applied in a single pass
+_ICS_ESCAPE_TABLE = str.maketrans(
+    {"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n", "\r": ""}
+)
+_ICS_NEEDS_ESCAPE = re.compile(r"[\\;,\n\r]").search
+
+# RFC 6868 caret encoding for quoted parameter values such as CN. They
+# can't contain DQUOTE and backslash is not an escape there; other
+# control characters are not allowed at all, so they are dropped
+_PARAM_ESCAPE_TABLE = str.maketrans(
+    {
+        **{chr(c): None for c in (*range(0x20), 0x7F) if c not in (0x09, 0x0A)},
+        "^": "^^",
+        '"': "^'",
+        "\n": "^n",
+    }
+)
+
+# Attendee lines only vary by address, so they are built by concatenation
+_ATTENDEE_PREFIX = "ATTENDEE;ROLE=REQ-PARTICIPANT;RSVP=TRUE:mailto:"
+
 
 def _utc_now() -> datetime:
     """Return current UTC datetime."""
-    return datetime.now(timezone.utc)
+    return datetime.now(UTC)
+
+
+@lru_cache(maxsize=32)
+def _format_organizer(name: str, email: str) -> str:
+    """Build an ORGANIZER line; cached since most events share an organizer."""
+    # CN is a quoted parameter value, so a stray quote must not end it
+    cn = name.translate(_PARAM_ESCAPE_TABLE)
+    return f'ORGANIZER;CN="{cn}":mailto:{email}'
+
 
+def _new_uid() -> str:
+    """Return a random RFC 4122 version 4 UUID string.
 
-@dataclass
+    Same format as str(uuid.uuid4()), without building a UUID object.
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+@dataclass(slots=True)
 class CalendarEvent:
     """Represents a single calendar event."""
 
@@ -53,7 +99,7 @@ class CalendarEvent:
     location: str = ""
     organizer_name: str = DEFAULT_ORGANIZER_NAME
     organizer_email: str = DEFAULT_ORGANIZER_EMAIL
-    uid: str = field(default_factory=lambda: str(uuid.uuid4()))
+    uid: str = field(default_factory=_new_uid)
     created_at: datetime = field(default_factory=_utc_now)
     sequence: int = 0
 
@@ -68,11 +114,13 @@ class CalendarEvent:
     @staticmethod
     def _normalize_email(email: str) -> str:
         """Normalize email address."""
-        email = email.strip()
-        if "<" in email and ">" in email:
-            # Extract email from "Name <email@example.com>" format
-            return email[email.find("<") + 1 : email.find(">")]
-        return email
+        # Extract email from "Name <email@example.com>" format
+        _, bracket, rest = email.partition("<")
+        if bracket:
+            inner, closed, _ = rest.partition(">")
+            if closed:
+                return inner.strip()
+        return email.strip()
 
     @property
     def duration_minutes(self) -> int:
@@ -89,217 +137,372 @@ class ICSGenerator:
     # CR LF required by iCalendar spec
     CRLF = "\r\n"
 
+    # Upper bound on threads used by write_events
+    WRITE_THREADS = 8
+
     def __init__(
         self,
         timezone: str = DEFAULT_TIMEZONE,
         prod_id: str = "-//MeetingPipeline//Meeting to Project Pipeline//EN",
-    ):
+    ) -> None:
         self.timezone = timezone
         self.prod_id = prod_id
 
+        # Constant per generator: build the CRLF-terminated text once
+        self._header = (
+            "BEGIN:VCALENDAR\r\nVERSION:2.0\r\n"
+            f"{self._fold_line(f'PRODID:{prod_id}')}\r\n"
+            "CALSCALE:GREGORIAN\r\n"
+        )
+
+        # Events in the output most recently returned by generate(),
+        # generate_batch() or generate_for_slots(). Plain per-instance state:
+        # share a generator across threads and this is whichever call ran last
+        self._last_event_count = 0
+
+    @property
+    def last_event_count(self) -> int:
+        """Number of VEVENTs in the last calendar generated, without rescanning it."""
+        return self._last_event_count
+
     def _fold_line(self, line: str) -> str:
         """
         Fold long lines according to RFC 5545.
-        Lines longer than 75 characters must be folded.
+        Lines longer than 75 octets must be folded.
         """
-        if len(line) <= self.LINE_LIMIT:
+        limit = self.LINE_LIMIT
+        length = len(line)
+        if length <= limit and line.isascii():
             return line
 
-        result = []
-        while line:
-            if len(line) <= self.LINE_LIMIT:
-                result.append(line)
-                break
-            result.append(line[: self.LINE_LIMIT])
-            line = " " + line[self.LINE_LIMIT :]
+        # Continuation lines start with a space, leaving room for limit - 1
+        # octets; slice the original once per chunk instead of re-copying
+        # the remainder each time
+        step = limit - 1
+        if line.isascii():
+            # One character per octet: slice the str directly
+            parts = [line[:limit]]
+            for i in range(limit, length, step):
+                parts.append(line[i : i + step])
+            return (self.CRLF + " ").join(parts)
+
+        data = line.encode("utf-8")
+        size = len(data)
+        if size <= limit:
+            return line
 
-        return self.CRLF.join(result)
+        # Slice the UTF-8 bytes, backing each cut off to a character start
+        parts = []
+        start = 0
+        end = limit
+        while end < size:
+            while data[end] & 0xC0 == 0x80:
+                end -= 1
+            parts.append(data[start:end].decode("utf-8"))
+            start = end
+            end = start + step
+        parts.append(data[start:].decode("utf-8"))
+        return (self.CRLF + " ").join(parts)
 
     def _escape_text(self, text: str) -> str:
         """Escape special characters in iCalendar text values."""
         if not text:
             return ""
-        # Escape backslash first, then other characters
-        text = text.replace("\\", "\\\\")
-        text = text.replace(";", "\\;")
-        text = text.replace(",", "\\,")
-        text = text.replace("\n", "\\n")
-        text = text.replace("\r", "")
-        return text
+        # Most titles and locations are plain text: return them uncopied
+        if not _ICS_NEEDS_ESCAPE(text):
+            return text
+        return text.translate(_ICS_ESCAPE_TABLE)
 
     def _format_datetime(self, dt: datetime) -> str:
         """Format datetime in UTC for iCalendar (basic format for max compatibility)."""
-        # For maximum compatibility, use UTC format
-        return dt.strftime("%Y%m%dT%H%M%SZ")
+        # For maximum compatibility, use UTC format. Plain int formatting
+        # avoids strftime's format-spec parsing and locale handling.
+        return (
+            f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+            f"T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}Z"
+        )
 
     def _format_datetime_local(self, dt: datetime) -> str:
         """Format datetime in local time."""
-        return dt.strftime("%Y%m%dT%H%M%S")
+        return (
+            f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+            f"T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}"
+        )
 
     def _format_date(self, dt: datetime) -> str:
         """Format date only."""
-        return dt.strftime("%Y%m%d")
+        return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
 
-    def generate(self, event: CalendarEvent) -> str:
-        """
-        Generate .ics content for a single event.
+    def _write_line(self, write: Callable[[str], Any], line: str) -> None:
+        """Write a folded content line and its CRLF terminator."""
+        write(self._fold_line(line))
+        write(self.CRLF)
 
-        Args:
-            event: CalendarEvent to convert to ICS format
+    @staticmethod
+    def _organizer_line(event: CalendarEvent) -> str:
+        """Build the ORGANIZER property shared by single and batch output."""
+        return _format_organizer(event.organizer_name, event.organizer_email)
 
-        Returns:
-            String containing valid iCalendar content
+    def _event_lines(self, event: CalendarEvent, modified: str) -> Iterator[str]:
         """
-        lines = []
+        Yield the unfolded VEVENT property lines for an event.
 
-        # Calendar header
-        lines.append("BEGIN:VCALENDAR")
-        lines.append("VERSION:2.0")
-        lines.append(f"PRODID:{self.prod_id}")
-        lines.append("CALSCALE:GREGORIAN")
-        lines.append("METHOD:REQUEST")
-
-        # Timezone definition for Asia/Kolkata (GMT+5:30)
-        lines.extend(self._get_timezone_definition())
-
-        # Event start
-        lines.append("BEGIN:VEVENT")
+        Shared by generate() and generate_batch(); excludes the BEGIN/END
+        markers so callers can add their own trailing properties.
+        """
+        created = self._format_datetime(event.created_at)
 
         # Unique identifier
-        lines.append(f"UID:{event.uid}")
+        yield f"UID:{event.uid}"
 
         # Timestamps
-        lines.append(f"DTSTAMP:{self._format_datetime(event.created_at)}")
-        lines.append(f"CREATED:{self._format_datetime(event.created_at)}")
-        lines.append(f"LAST-MODIFIED:{self._format_datetime(datetime.now(timezone.utc))}")
+        yield f"DTSTAMP:{created}"
+        yield f"CREATED:{created}"
+        yield f"LAST-MODIFIED:{modified}"
 
         # Event times - using UTC for maximum compatibility
-        lines.append(f"DTSTART:{self._format_datetime(event.start_time)}")
-        lines.append(f"DTEND:{self._format_datetime(event.end_time)}")
+        yield f"DTSTART:{self._format_datetime(event.start_time)}"
+        yield f"DTEND:{self._format_datetime(event.end_time)}"
 
         # Sequence number for updates
-        lines.append(f"SEQUENCE:{event.sequence}")
+        yield f"SEQUENCE:{event.sequence}"
 
         # Event details
-        lines.append(f"SUMMARY:{self._escape_text(event.title)}")
+        yield f"SUMMARY:{self._escape_text(event.title)}"
 
         if event.description:
-            lines.append(f"DESCRIPTION:{self._escape_text(event.description)}")
+            yield f"DESCRIPTION:{self._escape_text(event.description)}"
 
         if event.location:
-            lines.append(f"LOCATION:{self._escape_text(event.location)}")
+            yield f"LOCATION:{self._escape_text(event.location)}"
 
         # Status and priority
-        lines.append("STATUS:CONFIRMED")
-        lines.append("TRANSP:OPAQUE")
-
-        # Organizer
-        organizer = formataddr((event.organizer_name, event.organizer_email))
-        organizer_escaped = organizer.replace("\\", "\\\\").replace('"', '\\"')
-        lines.append(f'ORGANIZER;CN="{event.organizer_name}":mailto:{event.organizer_email}')
+        yield "STATUS:CONFIRMED"
+        yield "TRANSP:OPAQUE"
 
-        # Attendees
+        # Organizer and attendees
+        yield self._organizer_line(event)
         for attendee in event.attendees:
-            lines.append(f"ATTENDEE;ROLE=REQ-PARTICIPANT;RSVP=TRUE:mailto:{attendee}")
+            yield _ATTENDEE_PREFIX + attendee
 
         # Classification
-        lines.append("CLASS:PUBLIC")
+        yield "CLASS:PUBLIC"
 
-        # Apple Calendar specific for better compatibility
-        lines.append("X-APPLE-TRAVEL-ADVISORY-BEWARE;ACKNOWLEDGED=0:")
+    def generate(self, event: CalendarEvent) -> str:
+        """
+        Generate .ics content for a single event.
 
-        # Event end
-        lines.append("END:VEVENT")
+        Args:
+            event: CalendarEvent to convert to ICS format
 
-        # Calendar end
-        lines.append("END:VCALENDAR")
+        Returns:
+            String containing valid iCalendar content
+        """
+        ics = self._render(event)
+        self._last_event_count = 1
+        return ics
 
-        # Fold lines and join
-        folded_lines = [self._fold_line(line) for line in lines]
-        return self.CRLF.join(folded_lines) + self.CRLF
+    def _render(self, event: CalendarEvent) -> str:
+        """Build the .ics content for one event without touching any state."""
+        modified = self._format_datetime(datetime.now(UTC))
 
-    def _get_timezone_definition(self) -> list[str]:
-        """
-        Get VTIMEZONE block for Asia/Kolkata.
+        # Stream straight into one buffer instead of a list of lines
+        buf = io.StringIO()
+        write = buf.write
 
-        Returns timezone definition compatible with major calendar apps.
-        """
-        # Asia/Kolkata uses IST (Indian Standard Time) - GMT+5:30 all year
-        # No DST transitions
-        return [
-            "BEGIN:VTIMEZONE",
-            "TZID:Asia/Kolkata",
-            "X-LIC-LOCATION:Asia/Kolkata",
-            "BEGIN:STANDARD",
-            "DTSTART:19700101T000000",
-            "TZOFFSETFROM:+0530",
-            "TZOFFSETTO:+0530",
-            "TZNAME:IST",
-            "END:STANDARD",
-            "END:VTIMEZONE",
-        ]
+        # Calendar header. All times below are written in UTC ("Z" suffix),
+        # so no VTIMEZONE block is needed.
+        write(self._header)
+        write("METHOD:REQUEST\r\nBEGIN:VEVENT\r\n")
+
+        for line in self._event_lines(event, modified):
+            self._write_line(write, line)
+
+        # Apple Calendar specific for better compatibility
+        write("X-APPLE-TRAVEL-ADVISORY-BEWARE;ACKNOWLEDGED=0:\r\n")
+
+        # Event and calendar end
+        write("END:VEVENT\r\nEND:VCALENDAR\r\n")
+
+        return buf.getvalue()
 
     def generate_batch(self, events: list[CalendarEvent]) -> str:
         """
         Generate .ics content for multiple events in a single calendar.
 
+        Events are streamed line by line into one buffer, so no list of
+        every line in the calendar is ever built.
+
         Args:
             events: List of CalendarEvent objects
 
         Returns:
             String containing valid iCalendar content with multiple events
         """
+        ics = self._render_batch(events)
+        self._last_event_count = len(events)
+        return ics
+
+    def _render_batch(self, events: list[CalendarEvent]) -> str:
+        """Build one calendar holding every event without touching any state."""
         if not events:
             raise ValueError("At least one event is required")
 
-        lines = []
+        buf = io.StringIO()
+        write = buf.write
 
-        # Calendar header
-        lines.append("BEGIN:VCALENDAR")
-        lines.append("VERSION:2.0")
-        lines.append(f"PRODID:{self.prod_id}")
-        lines.append("CALSCALE:GREGORIAN")
-        lines.append("METHOD:PUBLISH")
+        # Calendar header (UTC times only, so no VTIMEZONE block)
+        write(self._header)
+        write("METHOD:PUBLISH\r\n")
 
-        # Timezone definition
-        lines.extend(self._get_timezone_definition())
+        # Every event in the batch is generated at the same moment
+        modified = self._format_datetime(datetime.now(UTC))
 
         # Add each event
         for event in events:
-            lines.append("BEGIN:VEVENT")
-            lines.append(f"UID:{event.uid}")
-            lines.append(f"DTSTAMP:{self._format_datetime(event.created_at)}")
-            lines.append(f"CREATED:{self._format_datetime(event.created_at)}")
-            lines.append(f"LAST-MODIFIED:{self._format_datetime(datetime.now(timezone.utc))}")
-            lines.append(f"DTSTART:{self._format_datetime(event.start_time)}")
-            lines.append(f"DTEND:{self._format_datetime(event.end_time)}")
-            lines.append(f"SEQUENCE:{event.sequence}")
-            lines.append(f"SUMMARY:{self._escape_text(event.title)}")
-
-            if event.description:
-                lines.append(f"DESCRIPTION:{self._escape_text(event.description)}")
-
-            if event.location:
-                lines.append(f"LOCATION:{self._escape_text(event.location)}")
-
-            lines.append("STATUS:CONFIRMED")
-            lines.append("TRANSP:OPAQUE")
-            lines.append(
-                f'ORGANIZER;CN="{event.organizer_name}":mailto:{event.organizer_email}'
-            )
-
-            for attendee in event.attendees:
-                lines.append(f"ATTENDEE;ROLE=REQ-PARTICIPANT:mailto:{attendee}")
-
-            lines.append("CLASS:PUBLIC")
-            lines.append("END:VEVENT")
+            write("BEGIN:VEVENT\r\n")
+            for line in self._event_lines(event, modified):
+                self._write_line(write, line)
+            write("END:VEVENT\r\n")
 
         # Calendar end
-        lines.append("END:VCALENDAR")
+        write("END:VCALENDAR\r\n")
+
+        return buf.getvalue()
+
+    def write_events(
+        self,
+        events: list[CalendarEvent],
+        out_dir: str | Path,
+        name_fn: Callable[[CalendarEvent, int], str] | None = None,
+    ) -> list[Path]:
+        """
+        Generate one .ics file per event and write them into a directory.
+
+        The files are written by save_ics_batch on a small thread pool, so
+        file writes overlap instead of running one by one.
 
-        # Fold lines and join
-        folded_lines = [self._fold_line(line) for line in lines]
-        return self.CRLF.join(folded_lines) + self.CRLF
+        Args:
+            events: Events to write
+            out_dir: Directory to write into (created if missing)
+            name_fn: Optional filename for (event, zero-based index);
+                defaults to event_1.ics, event_2.ics, ...
+
+        Returns:
+            List of Path objects of the written files, in input order
+        """
+        ics_contents = [self._render(event) for event in events]
+        filenames = (
+            [name_fn(event, index) for index, event in enumerate(events)]
+            if name_fn
+            else None
+        )
+        return save_ics_batch(
+            ics_contents, out_dir, filenames, max_workers=self.WRITE_THREADS
+        )
+
+    def generate_for_slots(
+        self,
+        base: CalendarEvent,
+        slots: list[tuple[datetime, datetime]],
+        titles: list[str] | None = None,
+        descriptions: list[str] | None = None,
+    ) -> list[str]:
+        """
+        Generate one .ics per time slot for otherwise identical events.
+
+        Everything shared by the slots (header, stamps, location, organizer,
+        attendees) is rendered once; each slot only formats its own UID,
+        times, summary and description.
+
+        Args:
+            base: Event supplying the shared properties
+            slots: List of (start_time, end_time) tuples in UTC
+            titles: Optional per-slot titles (defaults to base.title)
+            descriptions: Optional per-slot descriptions (defaults to base.description)
+
+        Returns:
+            List of .ics content strings, one per slot
+
+        Raises:
+            ValueError: If a slot ends before it starts, or titles/descriptions
+                do not match the number of slots
+        """
+        ics_contents = self._render_slots(base, slots, titles, descriptions)
+        self._last_event_count = len(ics_contents)
+        return ics_contents
+
+    def _render_slots(
+        self,
+        base: CalendarEvent,
+        slots: list[tuple[datetime, datetime]],
+        titles: list[str] | None,
+        descriptions: list[str] | None,
+    ) -> list[str]:
+        """Build one calendar per slot without touching any state."""
+        count = len(slots)
+        if titles is None:
+            titles = [base.title] * count
+        if descriptions is None:
+            descriptions = [base.description] * count
+        if len(titles) != count or len(descriptions) != count:
+            raise ValueError("titles and descriptions must have one entry per slot")
+
+        created = self._format_datetime(base.created_at)
+        modified = self._format_datetime(datetime.now(UTC))
+
+        # Shared head: calendar header through the per-event stamps
+        shared_start = (
+            f"{self._header}METHOD:REQUEST\r\nBEGIN:VEVENT\r\n"
+            f"DTSTAMP:{created}\r\nCREATED:{created}\r\n"
+            f"LAST-MODIFIED:{modified}\r\nSEQUENCE:{base.sequence}\r\n"
+        )
+
+        # Shared tail: location through the end of the calendar
+        suffix = io.StringIO()
+        write = suffix.write
+        if base.location:
+            self._write_line(write, f"LOCATION:{self._escape_text(base.location)}")
+        write("STATUS:CONFIRMED\r\nTRANSP:OPAQUE\r\n")
+        self._write_line(write, self._organizer_line(base))
+        for attendee in base.attendees:
+            self._write_line(write, _ATTENDEE_PREFIX + attendee)
+        write("CLASS:PUBLIC\r\n")
+        write("X-APPLE-TRAVEL-ADVISORY-BEWARE;ACKNOWLEDGED=0:\r\n")
+        write("END:VEVENT\r\nEND:VCALENDAR\r\n")
+        shared_end = suffix.getvalue()
+
+        ics_contents: list[str] = []
+        for (start_time, end_time), title, description in zip(slots, titles, descriptions):
+            if end_time <= start_time:
+                raise ValueError("End time must be after start time")
+
+            buf = io.StringIO()
+            write = buf.write
+            write(shared_start)
+            self._write_line(write, f"UID:{_new_uid()}")
+            self._write_line(write, f"DTSTART:{self._format_datetime(start_time)}")
+            self._write_line(write, f"DTEND:{self._format_datetime(end_time)}")
+            self._write_line(write, f"SUMMARY:{self._escape_text(title)}")
+            if description:
+                self._write_line(write, f"DESCRIPTION:{self._escape_text(description)}")
+            write(shared_end)
+            ics_contents.append(buf.getvalue())
+
+        return ics_contents
+
+
+# Shared generator for the module-level helpers. They call only the _render*
+# methods, which leave last_event_count alone, so concurrent callers don't
+# race on it
+_DEFAULT_GENERATOR = ICSGenerator()
+
+
+def _to_utc_naive(dt: datetime) -> datetime:
+    """Convert to naive UTC for consistent output; naive input is assumed UTC."""
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(UTC).replace(tzinfo=None)
 
 
 def create_calendar_event(
@@ -311,6 +514,7 @@ def create_calendar_event(
     location: str = "",
     organizer_name: str = DEFAULT_ORGANIZER_NAME,
     organizer_email: str = DEFAULT_ORGANIZER_EMAIL,
+    generator: ICSGenerator | None = None,
 ) -> str:
     """
     Create an .ics calendar event string.
@@ -324,6 +528,8 @@ def create_calendar_event(
         location: Optional location string
         organizer_name: Name of the event organizer
         organizer_email: Email of the event organizer
+        generator: ICSGenerator to render with; defaults to a shared
+            module-level instance
 
     Returns:
         String containing valid iCalendar (.ics) content
@@ -344,22 +550,10 @@ def create_calendar_event(
         >>> with open("meeting.ics", "w") as f:
         ...     f.write(ics)
     """
-    # Handle naive datetimes - assume UTC if not timezone aware
-    if start_time.tzinfo is None:
-        start_time = start_time.replace(tzinfo=__import__("datetime").timezone.utc)
-    if end_time.tzinfo is None:
-        end_time = end_time.replace(tzinfo=__import__("datetime").timezone.utc)
-
-    # Convert to UTC for consistent output
-    from datetime import timezone
-
-    start_utc = start_time.astimezone(timezone.utc).replace(tzinfo=None)
-    end_utc = end_time.astimezone(timezone.utc).replace(tzinfo=None)
-
     event = CalendarEvent(
         title=title,
-        start_time=start_utc,
-        end_time=end_utc,
+        start_time=_to_utc_naive(start_time),
+        end_time=_to_utc_naive(end_time),
         attendees=attendees,
         description=description,
         location=location,
@@ -367,20 +561,24 @@ def create_calendar_event(
         organizer_email=organizer_email,
     )
 
-    generator = ICSGenerator()
-    return generator.generate(event)
+    if generator is not None:
+        return generator.generate(event)
+    return _DEFAULT_GENERATOR._render(event)
 
 
 def create_calendar_from_meeting(
     meeting_data: dict[str, Any],
     organizer_name: str = DEFAULT_ORGANIZER_NAME,
     organizer_email: str = DEFAULT_ORGANIZER_EMAIL,
+    *,
+    batch: bool = False,
 ) -> list[str]:
     """
     Generate multiple .ics calendar events from meeting data dictionary.
 
     Supports extracting multiple events from a meeting transcript or analysis.
-    Each extracted event becomes a separate .ics file content.
+    Each extracted event becomes a separate .ics file content, unless
+    ``batch`` is set, in which case all events share one calendar.
 
     Expected meeting_data structure:
     {
@@ -412,9 +610,11 @@ def create_calendar_from_meeting(
         meeting_data: Dictionary containing meeting information and extracted events
         organizer_name: Name of the event organizer
         organizer_email: Email of the event organizer
+        batch: Return a single calendar (METHOD:PUBLISH) containing every
+            event instead of one calendar per event
 
     Returns:
-        List of .ics content strings, one per event
+        List of .ics content strings, one per event (or a single one if batch)
 
     Example:
         >>> meeting_data = {
@@ -436,6 +636,20 @@ def create_calendar_from_meeting(
     Raises:
         ValueError: If meeting_data doesn't contain events or has invalid structure
     """
+    events = _build_events(meeting_data, organizer_name, organizer_email)
+    generator = _DEFAULT_GENERATOR
+
+    if batch:
+        return [generator._render_batch(events)]
+    return [generator._render(event) for event in events]
+
+
+def _build_events(
+    meeting_data: dict[str, Any],
+    organizer_name: str,
+    organizer_email: str,
+) -> list[CalendarEvent]:
+    """Validate meeting data and build its CalendarEvent objects."""
     if not isinstance(meeting_data, dict):
         raise ValueError("meeting_data must be a dictionary")
 
@@ -444,11 +658,11 @@ def create_calendar_from_meeting(
         raise ValueError("meeting_data must contain 'events' list with at least one event")
 
     # Default attendees from meeting participants if available
-    default_attendees = meeting_data.get("participants", [])
-    default_location = meeting_data.get("default_location", "")
+    default_attendees = tuple(dict.fromkeys(meeting_data.get("participants", [])))
+    default_location: str = meeting_data.get("default_location", "")
+    meeting_title = meeting_data.get("meeting_title", "")
 
-    ics_contents: list[str] = []
-    generator = ICSGenerator()
+    events: list[CalendarEvent] = []
 
     for event_data in events_data:
         if not isinstance(event_data, dict):
@@ -472,20 +686,20 @@ def create_calendar_from_meeting(
             # Default to 1 hour if no end time or duration specified
             end_time = start_time + timedelta(hours=1)
 
-        # Collect attendees (event specific + defaults)
+        # Collect attendees (event specific + defaults), de-duplicated in order
         event_attendees = event_data.get("attendees", [])
-        all_attendees = list(set(event_attendees + default_attendees))
+        all_attendees = list(dict.fromkeys((*event_attendees, *default_attendees)))
 
         # Determine location (event specific with fallback to default)
         location = event_data.get("location", default_location)
 
-        # Build description with context
+        # Build description with context; real newlines are escaped to \n
+        # by the generator, as RFC 5545 requires
         description = event_data.get("description", "")
-        meeting_title = meeting_data.get("meeting_title", "")
         if meeting_title:
-            description = f"From: {meeting_title}\\n\\n{description}"
+            description = "".join(("From: ", meeting_title, "\n\n", description))
 
-        event = CalendarEvent(
+        events.append(CalendarEvent(
             title=event_data.get("title", "Untitled Event"),
             start_time=start_time,
             end_time=end_time,
@@ -494,12 +708,9 @@ def create_calendar_from_meeting(
             location=location,
             organizer_name=organizer_name,
             organizer_email=organizer_email,
-        )
+        ))
 
-        ics_content = generator.generate(event)
-        ics_contents.append(ics_content)
-
-    return ics_contents
+    return events
 
 
 def _parse_datetime(dt_str: str) -> datetime:
@@ -520,44 +731,42 @@ def _parse_datetime(dt_str: str) -> datetime:
     Raises:
         ValueError: If string cannot be parsed
     """
-    from datetime import timezone
-
     dt_str = dt_str.strip()
 
-    # Try ISO format with timezone
-    formats_with_tz = ["%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%d %H:%M:%S%z"]
-
-    # Try ISO format without timezone
-    formats_without_tz = [
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-    ]
-
-    # First try formats with timezone
-    for fmt in formats_with_tz:
+    # fromisoformat rejects a "Z" suffix and a "+0530"-style offset before
+    # 3.11; rewrite both with slice checks rather than a regex substitution
+    iso_str = dt_str
+    if dt_str[-1:] in ("Z", "z"):
+        iso_str = f"{dt_str[:-1]}+00:00"
+    elif len(dt_str) >= 5 and dt_str[-5] in "+-" and dt_str[-4:].isdecimal():
+        iso_str = f"{dt_str[:-2]}:{dt_str[-2:]}"
+
+    # Fast path: ISO 8601 (with or without offset, or date only) parsed in C
+    try:
+        return datetime.fromisoformat(iso_str)
+    except ValueError:
+        pass
+
+    # Fall back to strptime for the remaining naive forms
+    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
         try:
-            # Handle the colon in timezone offset (2024-03-15T10:00:00+05:30)
-            dt_normalized = dt_str
-            if len(dt_normalized) > 6 and dt_normalized[-3] == ":" and (
-                dt_normalized[-6] == "+" or dt_normalized[-6] == "-"
-            ):
-                dt_normalized = dt_normalized[:-3] + dt_normalized[-2:]
-            return datetime.strptime(dt_normalized, fmt)
-        except ValueError:
-            continue
-
-    # Then try without timezone (assume UTC)
-    for fmt in formats_without_tz:
-        try:
-            dt = datetime.strptime(dt_str, fmt)
-            return dt
+            return datetime.strptime(dt_str, fmt)
         except ValueError:
             continue
 
     raise ValueError(f"Cannot parse datetime string: {dt_str}")
 
 
+def _write_ics(path: Path, ics_content: str) -> None:
+    """
+    Write .ics content to path.
+
+    UTF-8 bytes are written in binary mode so the CRLF line endings RFC 5545
+    requires are written exactly as generated, on every platform.
+    """
+    path.write_bytes(ics_content.encode("utf-8"))
+
+
 def save_ics_to_file(
     ics_content: str, filepath: str | Path, filename: str | None = None
 ) -> Path:
@@ -591,13 +800,62 @@ def save_ics_to_file(
 
     # Ensure parent directory exists
     filepath.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write content (text mode with proper line endings)
-    filepath.write_text(ics_content, encoding="utf-8")
+    _write_ics(filepath, ics_content)
 
     return filepath
 
 
+def save_ics_batch(
+    ics_contents: list[str],
+    directory: str | Path,
+    filenames: list[str] | None = None,
+    *,
+    max_workers: int = 1,
+) -> list[Path]:
+    """
+    Save several .ics contents into one directory.
+
+    The directory is created once, and each file is written as UTF-8
+    bytes in binary mode.
+
+    Args:
+        ics_contents: The .ics content strings, e.g. from create_calendar_from_meeting
+        directory: Directory to write into (created if missing)
+        filenames: Optional filename per content; defaults to event_1.ics, event_2.ics, ...
+        max_workers: Write up to this many files at once on a thread pool
+
+    Returns:
+        List of Path objects of the saved files, in input order
+
+    Raises:
+        ValueError: If filenames is given but its length differs from ics_contents
+
+    Example:
+        >>> ics_list = create_calendar_from_meeting(meeting_data)
+        >>> paths = save_ics_batch(ics_list, "/tmp/calendar")
+    """
+    if filenames is None:
+        filenames = [f"event_{i}.ics" for i in range(1, len(ics_contents) + 1)]
+    elif len(filenames) != len(ics_contents):
+        raise ValueError(
+            f"Got {len(filenames)} filenames for {len(ics_contents)} .ics contents"
+        )
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    paths = [directory / filename for filename in filenames]
+    if max_workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+            # list() drains the map so the first write error is re-raised
+            list(executor.map(_write_ics, paths, ics_contents))
+    else:
+        for path, ics_content in zip(paths, ics_contents):
+            _write_ics(path, ics_content)
+
+    return paths
+
+
 def generate_meeting_invite(
     meeting_title: str,
     proposed_slots: list[tuple[datetime, datetime]],
@@ -632,23 +890,31 @@ def generate_meeting_invite(
         ...     description="Please choose one slot"
         ... )
     """
-    ics_contents = []
-
-    for idx, (start_time, end_time) in enumerate(proposed_slots, 1):
-        title = f"{meeting_title} (Option {idx})"
-        desc = f"{description}\n\n(Option {idx} of {len(proposed_slots)})"
-
-        ics = create_calendar_event(
-            title=title,
-            start_time=start_time,
-            end_time=end_time,
-            attendees=attendees,
-            description=desc,
-            location=location,
-        )
-        ics_contents.append(ics)
+    if not proposed_slots:
+        return []
+
+    total = len(proposed_slots)
+    slots = [(_to_utc_naive(start), _to_utc_naive(end)) for start, end in proposed_slots]
+
+    # Attendees, location and organizer are identical across slots, so they
+    # are rendered once and only the per-option parts vary
+    base = CalendarEvent(
+        title=meeting_title,
+        start_time=slots[0][0],
+        end_time=slots[0][1],
+        attendees=attendees,
+        description=description,
+        location=location,
+    )
 
-    return ics_contents
+    return _DEFAULT_GENERATOR._render_slots(
+        base,
+        slots,
+        titles=[f"{meeting_title} (Option {idx})" for idx in range(1, total + 1)],
+        descriptions=[
+            f"{description}\n\n(Option {idx} of {total})" for idx in range(1, total + 1)
+        ],
+    )
 
 
 # Export public API
@@ -658,6 +924,7 @@ __all__ = [
     "create_calendar_event",
     "create_calendar_from_meeting",
     "save_ics_to_file",
+    "save_ics_batch",
     "generate_meeting_invite",
     "DEFAULT_TIMEZONE",
     "DEFAULT_ORGANIZER_NAME",
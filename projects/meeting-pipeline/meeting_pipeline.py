@@ -7,13 +7,19 @@ calendar events, task lists, folder structures, and follow-up emails.
 
 from __future__ import annotations
 
+import argparse
 import re
 import os
+import inspect
+import tempfile
 import uuid
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Iterator, Optional, TypedDict, cast
 from enum import Enum
 
 
@@ -58,7 +64,7 @@ class Priority(Enum):
     CRITICAL = "critical"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Attendee:
     """Represents a meeting attendee."""
     name: str
@@ -69,7 +75,7 @@ class Attendee:
             raise ValidationError("Attendee name cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActionItem:
     """Represents an action item extracted from meeting notes."""
     description: str
@@ -83,7 +89,7 @@ class ActionItem:
             raise ValidationError("Action item description cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Decision:
     """Represents a decision made during the meeting."""
     description: str
@@ -94,7 +100,7 @@ class Decision:
             raise ValidationError("Decision description cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True)
 class Meeting:
     """Represents a parsed meeting with all extracted information."""
     title: str
@@ -110,14 +116,78 @@ class Meeting:
             raise ValidationError("Meeting title cannot be empty")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class EmailDrafts:
+    """Follow-up email drafts, keyed so callers can look one up directly."""
+    per_assignee: dict[str, str] = field(default_factory=dict)
+    summary: str = ""
+    
+    def __iter__(self) -> Iterator[str]:
+        """Yield the individual drafts in assignee order, then the summary."""
+        yield from self.per_assignee.values()
+        if self.summary:
+            yield self.summary
+    
+    def __len__(self) -> int:
+        return len(self.per_assignee) + (1 if self.summary else 0)
+
+
+@dataclass(slots=True)
 class PipelineOutput:
     """Container for all pipeline-generated artifacts."""
     meeting: Meeting
     calendar_path: Optional[Path] = None
     task_list_path: Optional[Path] = None
     folder_path: Optional[Path] = None
-    email_drafts: list[str] = field(default_factory=list)
+    email_drafts: EmailDrafts = field(default_factory=EmailDrafts)
+    # Only set by in-memory runs, which write no files
+    calendar_content: Optional[str] = None
+    task_list_content: Optional[str] = None
+
+
+def _accepts_keyword(func: Callable[..., Any], name: str) -> bool:
+    """Return whether func can be called with keyword argument ``name``."""
+    try:
+        params = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        p.kind is p.VAR_KEYWORD
+        or (p.name == name and p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY))
+        for p in params
+    )
+
+
+def _own_render(generator: Any, base: type) -> Optional[Callable[..., str]]:
+    """
+    Return ``generator.render`` if it produces what ``generate()`` writes.
+    
+    A generator that has no render(), or overrides generate() but inherits
+    render() from ``base``, has no string form that matches its files.
+    """
+    cls = type(generator)
+    render = getattr(cls, "render", None)
+    if render is None:
+        return None
+    overrides_generate = getattr(cls, "generate", None) is not getattr(base, "generate")
+    if overrides_generate and render is getattr(base, "render"):
+        return None
+    return cast(Callable[..., str], generator.render)
+
+
+def _render_via_generate(
+    generate: Callable[..., Path], meeting: Meeting, suffix: str, **kwargs: Any
+) -> str:
+    """Run a file-only generate() into a temporary file and return its text."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = generate(meeting, Path(tmp_dir) / f"artifact{suffix}", **kwargs)
+        return Path(path).read_bytes().decode("utf-8")
+
+
+@lru_cache(maxsize=1024)
+def _make_attendee(name: str, email: Optional[str] = None) -> Attendee:
+    """Return a shared Attendee per (name, email); safe since it is frozen."""
+    return Attendee(name=name, email=email)
 
 
 # =============================================================================
@@ -131,27 +201,92 @@ class MeetingParser:
     MEETING_TITLE_PATTERN = re.compile(r"^[Mm]eeting:\s*(.+)$", re.MULTILINE)
     DATE_PATTERN = re.compile(r"^[Dd]ate:\s*(.+)$", re.MULTILINE)
     ATTENDEES_PATTERN = re.compile(r"^[Aa]ttendees?:\s*(.+)$", re.MULTILINE)
-    ACTION_ITEM_PATTERN = re.compile(
-        r"^\s*(?:\d+\.\s*\[([ xX])\]\s*|[-*]\s*\[([ xX])\]\s*|[-*]\s*)?"
-        r"(.+?)(?:\s*[-–]\s*(\w+))?(?:\s*[-–]\s*[Dd]ue\s*(.+?))?$",
-        re.MULTILINE
+    # Action items are "<bullet> [ ] description - assignee - Due date"; the
+    # bullet/checkbox prefix is matched here and the tail is split in Python
+    ACTION_ITEM_PREFIX_PATTERN = re.compile(r"\s*(?:\d+\.\s*|[-*]\s*)?(?:\[([ xX])\]\s*)?")
+    ACTION_ITEM_DUE_PATTERN = re.compile(r"[Dd]ue\b:?\s*(.+)")
+    ACTION_ITEM_ASSIGNEE_PATTERN = re.compile(r"\w+")
+    DISCUSSION_SECTION_PATTERN = re.compile(r"[Dd]iscussion:?\s*\n((?:[-*].*\n?)+)")
+    ACTION_SECTION_PATTERN = re.compile(
+        r"[Aa]ction\s*[Ii]tems?:?\s*\n(.*?)(?:\n[A-Z]|\Z)", re.DOTALL
+    )
+    DECISIONS_SECTION_PATTERN = re.compile(r"[Dd]ecisions?:?\s*\n((?:[-*].*\n?)+)")
+    # Text of a non-empty "- item" / "* item" line, without surrounding space
+    BULLET_LINE_PATTERN = re.compile(r"^[^\S\n]*[-*][^\S\n]*(.*\S)", re.MULTILINE)
+    # Run over the newline-joined discussion points, so it must not match
+    # across a line break
+    IMPLIED_ACTION_PATTERN = re.compile(r"(\w+)[^\S\n]+(?:will|to)[^\S\n]+(.+)", re.IGNORECASE)
+    DUE_BY_PATTERN = re.compile(r"by\s+(.+?)(?:$|\.|,)", re.IGNORECASE)
+    # Phrases that mark a discussion point as a decision, in one alternation
+    DECISION_PATTERN = re.compile(
+        r"approved\s+for\s+|budget\s+approved|decided\s+(?:to|on)\s+|agreed\s+(?:to|on)\s+",
+        re.IGNORECASE,
+    )
+    DAY_PATTERN = re.compile(r"\b(\d{1,2})\b")
+    YEAR_PATTERN = re.compile(r"\b(20\d{2})\b")
+    # Every full month name contains its abbreviation, so matching these in
+    # calendar order finds the same month as matching the full names would
+    MONTH_ABBREVIATIONS = (
+        ("jan", 1), ("feb", 2), ("mar", 3), ("apr", 4), ("may", 5), ("jun", 6),
+        ("jul", 7), ("aug", 8), ("sep", 9), ("oct", 10), ("nov", 11), ("dec", 12),
     )
+    NAME_SPLIT_PATTERN = re.compile(r",\s*|\s+and\s+")
+    
+    # Supported date formats, in order of preference
+    DATE_FORMATS = (
+        "%b %d, %Y",
+        "%B %d, %Y",
+        "%Y-%m-%d",
+        "%d %b %Y",
+        "%d %B %Y",
+        "%m/%d/%Y",
+        "%d/%m/%Y",
+        "%b %d",  # Year omitted
+        "%B %d",  # Year omitted
+        "%d %b",  # Year omitted
+    )
+    # One alternation classifies a date string's shape in a single match.
+    # ISO dates are built directly from their digits; the other shapes map
+    # to the only formats that can parse them, and anything else falls
+    # back to trying all of DATE_FORMATS
+    DATE_SHAPE_PATTERN = re.compile(
+        r"(?P<iso>(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2}))"
+        r"|(?P<slash>\d{1,2}/\d{1,2}/\d{4})"
+        r"|(?P<mdy>[A-Za-z]+\s+\d{1,2},\s+\d{4})"
+        r"|(?P<dmy>\d{1,2}\s+[A-Za-z]+\s+\d{4})"
+        r"|(?P<md>[A-Za-z]+\s+\d{1,2})"
+        r"|(?P<dm>\d{1,2}\s+[A-Za-z]+)"
+    )
+    DATE_SHAPE_FORMATS = {
+        "slash": ("%m/%d/%Y", "%d/%m/%Y"),
+        "mdy": ("%b %d, %Y", "%B %d, %Y"),
+        "dmy": ("%d %b %Y", "%d %B %Y"),
+        "md": ("%b %d", "%B %d"),
+        "dm": ("%d %b",),
+    }
     
     def __init__(self, default_year: Optional[int] = None) -> None:
         self.default_year = default_year or datetime.now().year
     
-    def parse(self, notes: str) -> Meeting:
-        """Parse meeting notes text into a Meeting object."""
+    def parse(self, notes: str, now: Optional[datetime] = None) -> Meeting:
+        """Parse meeting notes text into a Meeting object.
+        
+        ``now`` supplies "today" for notes without a date; it defaults to
+        the current time.
+        """
         if not notes or not notes.strip():
             raise MeetingParseError("Meeting notes cannot be empty")
         
+        # Action items and decisions both scan the discussion; extract it once
+        discussion = self._extract_discussion(notes)
+        
         meeting = Meeting(
             title=self._extract_title(notes),
-            date=self._extract_date(notes),
+            date=self._extract_date(notes, now),
             attendees=self._extract_attendees(notes),
-            discussion_points=self._extract_discussion(notes),
-            action_items=self._extract_action_items(notes),
-            decisions=self._extract_decisions(notes),
+            discussion_points=discussion,
+            action_items=self._extract_action_items(notes, discussion),
+            decisions=self._extract_decisions(notes, discussion),
             raw_notes=notes
         )
         
@@ -164,10 +299,10 @@ class MeetingParser:
             return match.group(1).strip()
         
         # Fallback: use first line
-        first_line = notes.strip().split("\n")[0]
+        first_line = notes.strip().partition("\n")[0]
         return first_line[:50] if first_line else "Untitled Meeting"
     
-    def _extract_date(self, notes: str) -> datetime:
+    def _extract_date(self, notes: str, now: Optional[datetime] = None) -> datetime:
         """Extract meeting date from notes."""
         match = self.DATE_PATTERN.search(notes)
         if match:
@@ -175,22 +310,33 @@ class MeetingParser:
             return self._parse_date(date_str)
         
         # Default to today
-        return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        if now is None:
+            now = datetime.now()
+        return now.replace(hour=0, minute=0, second=0, microsecond=0)
     
     def _parse_date(self, date_str: str) -> datetime:
         """Parse date string into datetime object."""
-        date_formats = [
-            "%b %d, %Y",
-            "%B %d, %Y",
-            "%Y-%m-%d",
-            "%d %b %Y",
-            "%d %B %Y",
-            "%m/%d/%Y",
-            "%d/%m/%Y",
-            "%b %d",  # Year omitted
-            "%B %d",  # Year omitted
-            "%d %b",  # Year omitted
-        ]
+        # Due dates repeat a lot ("Friday", "Dec 15"); results are immutable
+        # and only depend on the string and the default year
+        return _parse_date_cached(date_str, self.default_year)
+    
+    def _parse_date_uncached(self, date_str: str) -> datetime:
+        """Parse date string into datetime object, bypassing the cache."""
+        shape = self.DATE_SHAPE_PATTERN.fullmatch(date_str)
+        date_formats: tuple[str, ...]
+        if shape is None or shape.lastgroup is None:
+            date_formats = self.DATE_FORMATS
+        elif shape.lastgroup == "iso":
+            try:
+                return datetime(
+                    int(shape["year"]), int(shape["month"]), int(shape["day"])
+                )
+            except ValueError:
+                return self._fuzzy_parse_date(date_str)
+        else:
+            # Only try the formats that fit the string's shape, so a typical
+            # date costs one strptime call instead of several failed ones
+            date_formats = self.DATE_SHAPE_FORMATS[shape.lastgroup]
         
         for fmt in date_formats:
             try:
@@ -207,32 +353,24 @@ class MeetingParser:
     
     def _fuzzy_parse_date(self, date_str: str) -> datetime:
         """Attempt to parse date with fuzzy matching."""
-        # Try to find month name and day
-        month_names = {
-            "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
-            "jul": 7, "aug": 8, "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dec": 12,
-            "january": 1, "february": 2, "march": 3, "april": 4, "june": 6,
-            "july": 7, "august": 8, "september": 9, "october": 10, "november": 11, "december": 12
-        }
-        
         date_lower = date_str.lower()
         month = None
         day = None
         year = self.default_year
         
         # Find month
-        for name, num in month_names.items():
+        for name, num in self.MONTH_ABBREVIATIONS:
             if name in date_lower:
                 month = num
                 break
         
         # Find day (number)
-        day_match = re.search(r"\b(\d{1,2})\b", date_str)
+        day_match = self.DAY_PATTERN.search(date_str)
         if day_match:
             day = int(day_match.group(1))
         
         # Find year (4-digit number)
-        year_match = re.search(r"\b(20\d{2})\b", date_str)
+        year_match = self.YEAR_PATTERN.search(date_str)
         if year_match:
             year = int(year_match.group(1))
         
@@ -252,14 +390,14 @@ class MeetingParser:
         
         attendees_str = match.group(1).strip()
         # Split by comma or 'and'
-        names = re.split(r",\s*|\s+and\s+", attendees_str)
+        names = self.NAME_SPLIT_PATTERN.split(attendees_str)
         
         attendees = []
         for name in names:
             name = name.strip()
             if name:
                 try:
-                    attendees.append(Attendee(name=name))
+                    attendees.append(_make_attendee(name))
                 except ValidationError:
                     continue
         
@@ -268,174 +406,246 @@ class MeetingParser:
     def _extract_discussion(self, notes: str) -> list[str]:
         """Extract discussion points from notes."""
         # Look for Discussion section
-        discussion_match = re.search(
-            r"[Dd]iscussion:?\s*\n((?:[-*].*\n?)+)",
-            notes
-        )
+        discussion_match = self.DISCUSSION_SECTION_PATTERN.search(notes)
         
-        points = []
-        if discussion_match:
-            discussion_text = discussion_match.group(1)
-            for line in discussion_text.split("\n"):
-                line = line.strip()
-                if line.startswith("-") or line.startswith("*"):
-                    point = line[1:].strip()
-                    if point:
-                        points.append(point)
+        if not discussion_match:
+            return []
         
-        return points
+        return [
+            match.group(1)
+            for match in self.BULLET_LINE_PATTERN.finditer(discussion_match.group(1))
+        ]
     
-    def _extract_action_items(self, notes: str) -> list[ActionItem]:
-        """Extract action items from notes."""
+    def _extract_action_items(
+        self, notes: str, discussion: Optional[list[str]] = None
+    ) -> list[ActionItem]:
+        """Extract action items from notes (reusing discussion if given)."""
+        if discussion is None:
+            discussion = self._extract_discussion(notes)
         action_items = []
         
         # Look for Action Items section
-        action_section_match = re.search(
-            r"[Aa]ction\s*[Ii]tems?:?\s*\n(.*?)(?:\n[A-Z]|\Z)",
-            notes,
-            re.DOTALL
-        )
+        action_section_match = self.ACTION_SECTION_PATTERN.search(notes)
         
         if action_section_match:
             section = action_section_match.group(1)
             
+            # A plain split/strip stays linear; a lazy "(\S.*?)\s*$" line
+            # regex backtracks quadratically on long whitespace runs
             for line in section.split("\n"):
                 line = line.strip()
                 if not line:
                     continue
                 
-                # Check for numbered or bullet format with checkbox
-                match = self.ACTION_ITEM_PATTERN.match(line)
-                if match:
-                    checkbox1, checkbox2, desc, assignee, due = match.groups()
-                    checkbox = checkbox1 or checkbox2 or ""
-                    completed = checkbox.lower() in ("x", "✓")
-                    
-                    if desc and desc.strip():
-                        due_date = None
-                        if due and due.strip():
-                            try:
-                                due_date = self._parse_date(due.strip())
-                            except MeetingParseError:
-                                pass
-                        
-                        try:
-                            action_items.append(ActionItem(
-                                description=desc.strip(),
-                                assignee=assignee.strip() if assignee else None,
-                                due_date=due_date,
-                                completed=completed
-                            ))
-                        except ValidationError:
-                            continue
-        
-        # Also scan discussion for implied action items
-        for point in self._extract_discussion(notes):
-            # Look for patterns like "X will do Y" or "X to do Y"
-            match = re.search(r"(\w+)\s+(?:will|to)\s+(.+)", point, re.IGNORECASE)
-            if match:
-                assignee = match.group(1)
-                action_desc = match.group(2)
+                # Strip numbered or bullet format with optional checkbox
+                prefix = self.ACTION_ITEM_PREFIX_PATTERN.match(line)
+                if prefix is None:
+                    continue
+                checkbox = prefix.group(1) or ""
+                completed = checkbox.lower() in ("x", "✓")
+                desc, assignee, due = self._split_action_item(line[prefix.end():])
                 
-                # Extract due date if mentioned
-                due_date = None
-                due_match = re.search(r"by\s+(.+?)(?:$|\.|,)", point, re.IGNORECASE)
-                if due_match:
+                if desc and desc.strip():
+                    due_date = None
+                    if due and due.strip():
+                        try:
+                            due_date = self._parse_date(due.strip())
+                        except MeetingParseError:
+                            pass
+                    
                     try:
-                        due_date = self._parse_date(due_match.group(1).strip())
-                    except MeetingParseError:
-                        pass
-                
+                        action_items.append(ActionItem(
+                            description=desc.strip(),
+                            assignee=assignee.strip() if assignee else None,
+                            due_date=due_date,
+                            completed=completed
+                        ))
+                    except ValidationError:
+                        continue
+        
+        # Also scan discussion for implied action items, like "X will do Y" or
+        # "X to do Y", in one pass; the greedy tail ends each match at the end
+        # of its point, so there is at most one match per point
+        discussion_text = "\n".join(discussion)
+        for match in self.IMPLIED_ACTION_PATTERN.finditer(discussion_text):
+            assignee = match.group(1)
+            action_desc = match.group(2)
+            
+            # Extract due date if mentioned anywhere in the point
+            due_date = None
+            point_start = discussion_text.rfind("\n", 0, match.start()) + 1
+            point = discussion_text[point_start:match.end()]
+            due_match = self.DUE_BY_PATTERN.search(point)
+            if due_match:
                 try:
-                    action_items.append(ActionItem(
-                        description=action_desc.strip(),
-                        assignee=assignee,
-                        due_date=due_date
-                    ))
-                except ValidationError:
-                    continue
+                    due_date = self._parse_date(due_match.group(1).strip())
+                except MeetingParseError:
+                    pass
+            
+            try:
+                action_items.append(ActionItem(
+                    description=action_desc.strip(),
+                    assignee=assignee,
+                    due_date=due_date
+                ))
+            except ValidationError:
+                continue
         
         return action_items
     
-    def _extract_decisions(self, notes: str) -> list[Decision]:
-        """Extract decisions from meeting notes."""
+    def _split_action_item(self, text: str) -> tuple[str, Optional[str], Optional[str]]:
+        """Split "description - assignee - Due date" into its parts.
+
+        Both trailing fields are optional and separated by a spaced hyphen
+        or en dash. Plain string splitting keeps this linear in the line
+        length, unlike a regex with a lazy body and optional tails.
+        """
+        parts = text.replace(" – ", " - ").rsplit(" - ", 2)
+        assignee = due = None
+        
+        if len(parts) > 1:
+            due_match = self.ACTION_ITEM_DUE_PATTERN.fullmatch(parts[-1].strip())
+            if due_match:
+                due = due_match.group(1)
+                parts.pop()
+        
+        if len(parts) > 1 and self.ACTION_ITEM_ASSIGNEE_PATTERN.fullmatch(parts[-1].strip()):
+            assignee = parts.pop().strip()
+        
+        return " - ".join(parts), assignee, due
+    
+    def _extract_decisions(
+        self, notes: str, discussion: Optional[list[str]] = None
+    ) -> list[Decision]:
+        """Extract decisions from meeting notes (reusing discussion if given)."""
+        if discussion is None:
+            discussion = self._extract_discussion(notes)
         decisions = []
         
         # Look for explicit decisions section
-        decisions_match = re.search(
-            r"[Dd]ecisions?:?\s*\n((?:[-*].*\n?)+)",
-            notes
-        )
+        decisions_match = self.DECISIONS_SECTION_PATTERN.search(notes)
         
         if decisions_match:
-            decisions_text = decisions_match.group(1)
-            for line in decisions_text.split("\n"):
-                line = line.strip()
-                if line.startswith("-") or line.startswith("*"):
-                    desc = line[1:].strip()
-                    if desc:
-                        try:
-                            decisions.append(Decision(description=desc))
-                        except ValidationError:
-                            continue
+            for match in self.BULLET_LINE_PATTERN.finditer(decisions_match.group(1)):
+                try:
+                    decisions.append(Decision(description=match.group(1)))
+                except ValidationError:
+                    continue
         
         # Also scan discussion for decision patterns
-        for point in self._extract_discussion(notes):
+        for point in discussion:
             # Patterns that indicate decisions
-            decision_patterns = [
-                r"[Aa]pproved\s+for\s+(.+)",
-                r"[Bb]udget\s+approved",
-                r"[Dd]ecided\s+(?:to|on)\s+(.+)",
-                r"[Aa]greed\s+(?:to|on)\s+(.+)",
-            ]
-            
-            for pattern in decision_patterns:
-                if re.search(pattern, point, re.IGNORECASE):
-                    try:
-                        decisions.append(
-                            Decision(description=point, context="From discussion")
-                        )
-                    except ValidationError:
-                        pass
-                    break
+            if self.DECISION_PATTERN.search(point):
+                try:
+                    decisions.append(
+                        Decision(description=point, context="From discussion")
+                    )
+                except ValidationError:
+                    pass
         
         return decisions
 
 
+@lru_cache(maxsize=256)
+def _parse_date_cached(date_str: str, default_year: int) -> datetime:
+    """Cached MeetingParser date parsing, keyed by string and default year."""
+    return MeetingParser(default_year)._parse_date_uncached(date_str)
+
+
 # =============================================================================
 # Generators
 # =============================================================================
 
+# Characters that are unsafe in file names, or a run of whitespace
+_UNSAFE_NAME_PATTERN = re.compile(r'(\s+)|[<>:"/\\|?*]')
+
+
+def _replace_unsafe(match: re.Match[str]) -> str:
+    return "_" if match.group(1) else "-"
+
+
+@lru_cache(maxsize=4)
+def _sanitize_name(title: str) -> str:
+    """Make a title safe for file and folder names (may return "")."""
+    return _UNSAFE_NAME_PATTERN.sub(_replace_unsafe, title).strip("._-")
+
+
+def _format_date(value: datetime, fmt: str) -> str:
+    """Format a display date, reusing the result for repeated dates."""
+    # Aware datetimes at the same instant compare equal but can fall on
+    # different calendar days, so the zone is part of the key
+    return _format_date_cached(value, value.tzinfo, fmt)
+
+
+@lru_cache(maxsize=256)
+def _format_date_cached(value: datetime, tzinfo: object, fmt: str) -> str:
+    return value.strftime(fmt)
+
+
 class CalendarGenerator:
     """Generates ICS calendar files from meeting data."""
     
     DEFAULT_DURATION_MINUTES = 60
     
+    # RFC 5545 TEXT escaping, applied in a single pass
+    ICS_ESCAPE_TABLE = str.maketrans(
+        {"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"}
+    )
+    # Fixed part of the event up to the description, filled in one
+    # format_map call; datetimes are formatted through the format specs
+    ICS_EVENT_TEMPLATE = (
+        "BEGIN:VCALENDAR\n"
+        "VERSION:2.0\n"
+        "PRODID:-//Meeting Pipeline//EN\n"
+        "BEGIN:VEVENT\n"
+        "UID:{uid}\n"
+        "DTSTAMP:{created:%Y%m%dT%H%M%SZ}\n"
+        "DTSTART;TZID=Local:{start:%Y%m%dT%H%M%S}\n"
+        "DTEND;TZID=Local:{end:%Y%m%dT%H%M%S}\n"
+        "SUMMARY:{summary}\n"
+        "DESCRIPTION:{description}"
+    )
+    
     def generate(
         self,
         meeting: Meeting,
         output_path: Path,
-        duration_minutes: int = DEFAULT_DURATION_MINUTES
+        duration_minutes: int = DEFAULT_DURATION_MINUTES,
+        now: Optional[datetime] = None
     ) -> Path:
-        """Generate ICS calendar file for the meeting."""
-        if not meeting:
-            raise ValidationError("Meeting cannot be None")
+        """Generate ICS calendar file for the meeting.
+        
+        ``now`` is used for the DTSTAMP and defaults to the current time.
+        """
+        content = self.render(meeting, duration_minutes, now)
         
         try:
-            ics_content = self._create_ics_content(meeting, duration_minutes)
-            output_path.write_text(ics_content, encoding="utf-8")
+            output_path.write_bytes(content.encode("utf-8"))
             return output_path
         except OSError as e:
             raise CalendarGenerationError(f"Failed to write calendar file: {e}") from e
     
-    def _create_ics_content(
+    def render(
         self,
         meeting: Meeting,
-        duration_minutes: int
+        duration_minutes: int = DEFAULT_DURATION_MINUTES,
+        now: Optional[datetime] = None
     ) -> str:
-        """Create ICS format calendar content."""
+        """Return the ICS calendar content; generate() writes exactly this."""
+        if not meeting:
+            raise ValidationError("Meeting cannot be None")
+        
+        return "\n".join(self._iter_ics_lines(meeting, duration_minutes, now))
+    
+    def _iter_ics_lines(
+        self,
+        meeting: Meeting,
+        duration_minutes: int,
+        now: Optional[datetime] = None
+    ) -> Iterator[str]:
+        """Yield the ICS content line by line."""
         uid = uuid.uuid4()
-        created = datetime.now()
+        created = datetime.now() if now is None else now
         
         start_time = meeting.date
         if start_time.hour == 0 and start_time.minute == 0:
@@ -444,160 +654,157 @@ class CalendarGenerator:
         
         end_time = start_time + timedelta(minutes=duration_minutes)
         
-        # Format dates for ICS (UTC format)
-        dtstamp = created.strftime("%Y%m%dT%H%M%SZ")
-        dtstart = start_time.strftime("%Y%m%dT%H%M%S")
-        dtend = end_time.strftime("%Y%m%dT%H%M%S")
+        description = "\n".join(self._iter_description_lines(meeting))
+        
+        yield self.ICS_EVENT_TEMPLATE.format_map({
+            "uid": uid,
+            "created": created,
+            "start": start_time,
+            "end": end_time,
+            "summary": meeting.title,
+            "description": description.translate(self.ICS_ESCAPE_TABLE),
+        })
         
-        attendees_str = "\n".join([
-            f"ATTENDEE;CN={a.name}:MAILTO:"
-            for a in meeting.attendees
-        ])
+        for a in meeting.attendees:
+            yield f"ATTENDEE;CN={a.name}:MAILTO:"
         
-        description_parts = [meeting.title]
+        yield "END:VEVENT"
+        yield "END:VCALENDAR"
+    
+    def _iter_description_lines(self, meeting: Meeting) -> Iterator[str]:
+        """Yield the unescaped lines of the event description."""
+        yield meeting.title
         if meeting.discussion_points:
-            description_parts.append("\nDiscussion:")
-            description_parts.extend([f"- {p}" for p in meeting.discussion_points])
+            yield "\nDiscussion:"
+            for point in meeting.discussion_points:
+                yield f"- {point}"
         if meeting.action_items:
-            description_parts.append("\nAction Items:")
+            yield "\nAction Items:"
             for item in meeting.action_items:
                 status = "[x]" if item.completed else "[ ]"
                 assignee = f" ({item.assignee})" if item.assignee else ""
-                description_parts.append(f"{status} {item.description}{assignee}")
-        
-        description = "\\n".join(description_parts)
-        description = description.replace(",", "\\,")
-        
-        ics_lines = [
-            "BEGIN:VCALENDAR",
-            "VERSION:2.0",
-            "PRODID:-//Meeting Pipeline//EN",
-            "BEGIN:VEVENT",
-            f"UID:{uid}",
-            f"DTSTAMP:{dtstamp}",
-            f"DTSTART;TZID=Local:{dtstart}",
-            f"DTEND;TZID=Local:{dtend}",
-            f"SUMMARY:{meeting.title}",
-            f"DESCRIPTION:{description}",
-        ]
-        
-        if attendees_str:
-            ics_lines.append(attendees_str)
-        
-        ics_lines.extend([
-            "END:VEVENT",
-            "END:VCALENDAR"
-        ])
-        
-        return "\n".join(ics_lines)
+                yield f"{status} {item.description}{assignee}"
 
 
 class TaskListGenerator:
     """Generates Markdown task list documents."""
     
+    # Fixed document head and summary, each filled in one format_map call
+    MARKDOWN_HEADER_TEMPLATE = (
+        "# {title}\n"
+        "\n"
+        "**Date:** {date}\n"
+        "\n"
+        "**Attendees:** {attendees}\n"
+        "\n"
+        "---\n"
+        "\n"
+        "## Discussion Points\n"
+    )
+    MARKDOWN_SUMMARY_TEMPLATE = (
+        "## Summary\n"
+        "\n"
+        "- **Total Action Items:** {total}\n"
+        "- **Completed:** {completed}\n"
+        "- **Pending:** {pending}\n"
+        "- **Decisions Made:** {decisions}"
+    )
+    
     def generate(self, meeting: Meeting, output_path: Path) -> Path:
         """Generate Markdown task list file."""
-        if not meeting:
-            raise ValidationError("Meeting cannot be None")
+        content = self.render(meeting)
         
         try:
-            md_content = self._create_markdown_content(meeting)
-            output_path.write_text(md_content, encoding="utf-8")
+            output_path.write_bytes(content.encode("utf-8"))
             return output_path
         except OSError as e:
             raise FileSystemError(f"Failed to write task list file: {e}") from e
     
-    def _create_markdown_content(self, meeting: Meeting) -> str:
-        """Create Markdown formatted task list."""
-        lines = [
-            f"# {meeting.title}",
-            "",
-            f"**Date:** {meeting.date.strftime('%B %d, %Y')}",
-            "",
-            f"**Attendees:** {', '.join(a.name for a in meeting.attendees)}",
-            "",
-            "---",
-            "",
-            "## Discussion Points",
-            ""
-        ]
+    def render(self, meeting: Meeting) -> str:
+        """Return the Markdown task list; generate() writes exactly this."""
+        if not meeting:
+            raise ValidationError("Meeting cannot be None")
+        
+        return "\n".join(self._iter_markdown_lines(meeting))
+    
+    def _iter_markdown_lines(self, meeting: Meeting) -> Iterator[str]:
+        """Yield the Markdown task list line by line."""
+        yield self.MARKDOWN_HEADER_TEMPLATE.format_map({
+            "title": meeting.title,
+            "date": _format_date(meeting.date, "%B %d, %Y"),
+            "attendees": ", ".join(a.name for a in meeting.attendees),
+        })
         
         for point in meeting.discussion_points:
-            lines.append(f"- {point}")
+            yield f"- {point}"
         
         if not meeting.discussion_points:
-            lines.append("_No discussion points recorded_")
+            yield "_No discussion points recorded_"
         
-        lines.extend([
-            "",
-            "## Decisions",
-            ""
-        ])
+        yield ""
+        yield "## Decisions"
+        yield ""
         
         for decision in meeting.decisions:
             if decision.context:
-                lines.append(f"- **{decision.description}** _(Context: {decision.context})_")
+                yield f"- **{decision.description}** _(Context: {decision.context})_"
             else:
-                lines.append(f"- {decision.description}")
+                yield f"- {decision.description}"
         
         if not meeting.decisions:
-            lines.append("_No decisions recorded_")
+            yield "_No decisions recorded_"
         
-        lines.extend([
-            "",
-            "## Action Items",
-            ""
-        ])
+        yield ""
+        yield "## Action Items"
+        yield ""
         
-        # Group by assignee
-        by_assignee: dict[str, list[ActionItem]] = {}
+        # Group by assignee, counting completed items in the same pass
+        by_assignee: defaultdict[str, list[ActionItem]] = defaultdict(list)
         unassigned: list[ActionItem] = []
+        completed_count = 0
         
         for item in meeting.action_items:
+            if item.completed:
+                completed_count += 1
             if item.assignee:
-                if item.assignee not in by_assignee:
-                    by_assignee[item.assignee] = []
                 by_assignee[item.assignee].append(item)
             else:
                 unassigned.append(item)
         
         # Output grouped items
         for assignee, items in sorted(by_assignee.items()):
-            lines.append(f"### {assignee}")
-            lines.append("")
+            yield f"### {assignee}"
+            yield ""
             for item in items:
                 status = "[x]" if item.completed else "[ ]"
-                due = f" (Due: {item.due_date.strftime('%b %d')})" if item.due_date else ""
+                due = f" (Due: {_format_date(item.due_date, '%b %d')})" if item.due_date else ""
                 priority = f" [{item.priority.value.upper()}]" if item.priority != Priority.MEDIUM else ""
-                lines.append(f"- {status} {item.description}{due}{priority}")
-            lines.append("")
+                yield f"- {status} {item.description}{due}{priority}"
+            yield ""
         
         if unassigned:
-            lines.append("### Unassigned")
-            lines.append("")
+            yield "### Unassigned"
+            yield ""
             for item in unassigned:
                 status = "[x]" if item.completed else "[ ]"
-                due = f" (Due: {item.due_date.strftime('%b %d')})" if item.due_date else ""
-                lines.append(f"- {status} {item.description}{due}")
-            lines.append("")
+                due = f" (Due: {_format_date(item.due_date, '%b %d')})" if item.due_date else ""
+                yield f"- {status} {item.description}{due}"
+            yield ""
         
         if not meeting.action_items:
-            lines.append("_No action items_")
+            yield "_No action items_"
         
         # Add summary
-        lines.extend([
-            "",
-            "---",
-            "",
-            "## Summary",
-            "",
-            f"- **Total Action Items:** {len(meeting.action_items)}",
-            f"- **Completed:** {sum(1 for i in meeting.action_items if i.completed)}",
-            f"- **Pending:** {sum(1 for i in meeting.action_items if not i.completed)}",
-            f"- **Decisions Made:** {len(meeting.decisions)}",
-        ])
-        
-        return "\n".join(lines)
+        yield ""
+        yield "---"
+        yield ""
+        total_count = len(meeting.action_items)
+        yield self.MARKDOWN_SUMMARY_TEMPLATE.format_map({
+            "total": total_count,
+            "completed": completed_count,
+            "pending": total_count - completed_count,
+            "decisions": len(meeting.decisions),
+        })
 
 
 class FolderGenerator:
@@ -613,27 +820,68 @@ class FolderGenerator:
         "archive"
     ]
     
+    DEFAULT_LEAF_DIRS = [
+        "documents/notes",
+        "documents/reports",
+        "tasks",
+        "resources/references",
+        "archive"
+    ]
+    
+    # Static tail of the project README, after the attendee list
+    README_FOOTER_LINES = (
+        "",
+        "## Project Structure",
+        "",
+        "```",
+        ".",
+        "├── documents/        # Meeting notes, reports, documentation",
+        "│   ├── notes/        # Raw meeting notes",
+        "│   └── reports/      # Generated reports",
+        "├── tasks/            # Task lists and tracking",
+        "├── resources/        # Reference materials",
+        "│   └── references/   # External references and links",
+        "└── archive/          # Archived/deprecated items",
+        "```",
+        "",
+        "## Quick Links",
+        "",
+        "- [Task List](tasks/README.md)",
+        "",
+        "---",
+        "",
+        "_Generated by Meeting Pipeline_",
+    )
+    
     def generate(
         self,
         meeting: Meeting,
         base_path: Path,
-        structure: Optional[list[str]] = None
+        structure: Optional[list[str]] = None,
+        now: Optional[datetime] = None
     ) -> Path:
-        """Generate project folder structure."""
+        """Generate project folder structure.
+        
+        ``now`` sets the folder's date prefix and defaults to the current time.
+        """
         if not meeting:
             raise ValidationError("Meeting cannot be None")
         
         # Create folder name from meeting title
-        folder_name = self._sanitize_folder_name(meeting.title)
+        folder_name = self._sanitize_folder_name(meeting.title, now)
         project_path = base_path / folder_name
         
         try:
             project_path.mkdir(parents=True, exist_ok=True)
             
-            # Create subdirectories
-            dirs_to_create = structure or self.DEFAULT_STRUCTURE
+            # Create subdirectories; parents=True covers the intermediate ones
+            if structure:
+                dirs_to_create = self._leaf_dirs(structure)
+            else:
+                dirs_to_create = self.DEFAULT_LEAF_DIRS
+            base = os.fspath(project_path)
             for subdir in dirs_to_create:
-                (project_path / subdir).mkdir(parents=True, exist_ok=True)
+                os.makedirs(os.path.join(base, subdir), exist_ok=True)
             
             # Create a README in the project folder
             readme_content = self._create_project_readme(meeting)
@@ -643,169 +891,174 @@ class FolderGenerator:
         except OSError as e:
             raise FileSystemError(f"Failed to create folder structure: {e}") from e
     
-    def _sanitize_folder_name(self, title: str) -> str:
+    @staticmethod
+    def _leaf_dirs(structure: Iterable[str]) -> list[str]:
+        """Drop directories that are a prefix of another entry in the structure."""
+        dirs = list(dict.fromkeys(structure))
+        return [
+            d for d in dirs
+            if not any(other.startswith(d.rstrip("/") + "/") for other in dirs)
+        ]
+    
+    def _sanitize_folder_name(self, title: str, now: Optional[datetime] = None) -> str:
         """Convert meeting title to safe folder name."""
         # Remove or replace unsafe characters
-        safe = re.sub(r'[<>:"/\\|?*]', "-", title)
-        safe = re.sub(r'\s+', "_", safe)
-        safe = safe.strip("._-")
+        safe = _sanitize_name(title)
         
         # Add date prefix for organization
-        date_prefix = datetime.now().strftime("%Y%m%d")
+        if now is None:
+            now = datetime.now()
+        date_prefix = now.strftime("%Y%m%d")
         return f"{date_prefix}_{safe}" if safe else f"{date_prefix}_meeting"
     
     def _create_project_readme(self, meeting: Meeting) -> str:
         """Create project README content."""
-        lines = [
-            f"# {meeting.title}",
-            "",
-            f"**Meeting Date:** {meeting.date.strftime('%B %d, %Y')}",
-            "",
-            "**Attendees:**",
-        ]
+        return "\n".join(self._iter_project_readme_lines(meeting))
+    
+    def _iter_project_readme_lines(self, meeting: Meeting) -> Iterator[str]:
+        """Yield the project README line by line."""
+        yield f"# {meeting.title}"
+        yield ""
+        yield f"**Meeting Date:** {_format_date(meeting.date, '%B %d, %Y')}"
+        yield ""
+        yield "**Attendees:**"
         
         for attendee in meeting.attendees:
-            lines.append(f"- {attendee.name}")
-        
-        lines.extend([
-            "",
-            "## Project Structure",
-            "",
-            "```",
-            ".",
-            "├── documents/        # Meeting notes, reports, documentation",
-            "│   ├── notes/        # Raw meeting notes",
-            "│   └── reports/      # Generated reports",
-            "├── tasks/            # Task lists and tracking",
-            "├── resources/        # Reference materials",
-            "│   └── references/   # External references and links",
-            "└── archive/          # Archived/deprecated items",
-            "```",
-            "",
-            "## Quick Links",
-            "",
-            "- [Task List](tasks/README.md)",
-            "",
-            "---",
-            "",
-            "_Generated by Meeting Pipeline_"
-        ])
-        
-        return "\n".join(lines)
+            yield f"- {attendee.name}"
+        
+        yield from self.README_FOOTER_LINES
 
 
 class EmailDraftGenerator:
     """Generates follow-up email drafts."""
     
-    def generate(self, meeting: Meeting) -> list[str]:
+    def generate(self, meeting: Meeting) -> EmailDrafts:
         """Generate email drafts for the meeting follow-up."""
         if not meeting:
             raise ValidationError("Meeting cannot be None")
         
-        emails = []
+        per_assignee: dict[str, str] = {}
         
-        # Group action items by assignee
-        by_assignee: dict[str, list[ActionItem]] = {}
-        for item in meeting.action_items:
-            if item.assignee:
-                if item.assignee not in by_assignee:
-                    by_assignee[item.assignee] = []
-                by_assignee[item.assignee].append(item)
+        # Every draft mentions the meeting date, so format it only once
+        meeting_date = _format_date(meeting.date, "%B %d, %Y")
         
-        # Generate individual emails for each assignee
-        for assignee, items in by_assignee.items():
-            email = self._create_individual_email(meeting, assignee, items)
-            emails.append(email)
+        # Without action items there is nobody to write to individually
+        if meeting.action_items:
+            # Group action items by assignee
+            by_assignee: defaultdict[str, list[ActionItem]] = defaultdict(list)
+            for item in meeting.action_items:
+                if item.assignee:
+                    by_assignee[item.assignee].append(item)
+            
+            # Generate individual emails for each assignee
+            for assignee, items in by_assignee.items():
+                per_assignee[assignee] = self._create_individual_email(
+                    meeting, assignee, items, meeting_date
+                )
         
         # Generate summary email for all attendees
-        summary_email = self._create_summary_email(meeting)
-        emails.append(summary_email)
+        summary_email = self._create_summary_email(meeting, meeting_date)
         
-        return emails
+        return EmailDrafts(per_assignee=per_assignee, summary=summary_email)
     
     def _create_individual_email(
         self,
         meeting: Meeting,
         assignee: str,
-        items: list[ActionItem]
+        items: list[ActionItem],
+        meeting_date: Optional[str] = None
     ) -> str:
         """Create personalized email for an assignee."""
-        lines = [
-            f"Subject: Action Items from {meeting.title}",
-            f"To: {assignee}",
-            "",
-            f"Hi {assignee},",
-            "",
-            f"Thank you for attending the {meeting.title} meeting on {meeting.date.strftime('%B %d, %Y')}. Following up on the action items assigned to you:",
-            "",
-        ]
+        return "\n".join(
+            self._iter_individual_email_lines(meeting, assignee, items, meeting_date)
+        )
+    
+    def _iter_individual_email_lines(
+        self,
+        meeting: Meeting,
+        assignee: str,
+        items: list[ActionItem],
+        meeting_date: Optional[str] = None
+    ) -> Iterator[str]:
+        """Yield an assignee's email line by line."""
+        if meeting_date is None:
+            meeting_date = _format_date(meeting.date, "%B %d, %Y")
+        
+        yield f"Subject: Action Items from {meeting.title}"
+        yield f"To: {assignee}"
+        yield ""
+        yield f"Hi {assignee},"
+        yield ""
+        yield f"Thank you for attending the {meeting.title} meeting on {meeting_date}. Following up on the action items assigned to you:"
+        yield ""
         
         for i, item in enumerate(items, 1):
-            due = f" (Due: {item.due_date.strftime('%B %d, %Y')})" if item.due_date else ""
-            lines.append(f"{i}. {item.description}{due}")
-        
-        lines.extend([
-            "",
-            "Please let me know if you have any questions or need clarification on any of these items.",
-            "",
-            "Best regards,",
-            "",
-            "[Your Name]"
-        ])
-        
-        return "\n".join(lines)
+            due = f" (Due: {_format_date(item.due_date, '%B %d, %Y')})" if item.due_date else ""
+            yield f"{i}. {item.description}{due}"
+        
+        yield ""
+        yield "Please let me know if you have any questions or need clarification on any of these items."
+        yield ""
+        yield "Best regards,"
+        yield ""
+        yield "[Your Name]"
     
-    def _create_summary_email(self, meeting: Meeting) -> str:
+    def _create_summary_email(
+        self,
+        meeting: Meeting,
+        meeting_date: Optional[str] = None
+    ) -> str:
         """Create summary email for all attendees."""
-        lines = [
-            f"Subject: Meeting Recap - {meeting.title}",
-            f"To: {', '.join(a.name for a in meeting.attendees)}",
-            "",
-            f"Hello everyone,",
-            "",
-            f"Thank you for attending our meeting on {meeting.date.strftime('%B %d, %Y')}. Here's a summary of what we discussed and the action items:",
-            "",
-            "## Discussion Summary",
-            ""
-        ]
+        return "\n".join(self._iter_summary_email_lines(meeting, meeting_date))
+    
+    def _iter_summary_email_lines(
+        self,
+        meeting: Meeting,
+        meeting_date: Optional[str] = None
+    ) -> Iterator[str]:
+        """Yield the all-attendees summary email line by line."""
+        if meeting_date is None:
+            meeting_date = _format_date(meeting.date, "%B %d, %Y")
+        
+        yield f"Subject: Meeting Recap - {meeting.title}"
+        yield f"To: {', '.join(a.name for a in meeting.attendees)}"
+        yield ""
+        yield "Hello everyone,"
+        yield ""
+        yield f"Thank you for attending our meeting on {meeting_date}. Here's a summary of what we discussed and the action items:"
+        yield ""
+        yield "## Discussion Summary"
+        yield ""
         
         for point in meeting.discussion_points[:5]:  # Limit to first 5
-            lines.append(f"- {point}")
+            yield f"- {point}"
         
         if len(meeting.discussion_points) > 5:
-            lines.append(f"- _... and {len(meeting.discussion_points) - 5} more items_")
+            yield f"- _... and {len(meeting.discussion_points) - 5} more items_"
         
-        lines.extend([
-            "",
-            "## Key Decisions",
-            ""
-        ])
+        yield ""
+        yield "## Key Decisions"
+        yield ""
         
         for decision in meeting.decisions:
-            lines.append(f"- {decision.description}")
+            yield f"- {decision.description}"
         
-        lines.extend([
-            "",
-            "## Action Items Summary",
-            ""
-        ])
+        yield ""
+        yield "## Action Items Summary"
+        yield ""
         
         for item in meeting.action_items:
             assignee = f" ({item.assignee})" if item.assignee else ""
-            due = f" - Due {item.due_date.strftime('%b %d')}" if item.due_date else ""
+            due = f" - Due {_format_date(item.due_date, '%b %d')}" if item.due_date else ""
             status = "✓ " if item.completed else "○ "
-            lines.append(f"{status}{item.description}{assignee}{due}")
-        
-        lines.extend([
-            "",
-            "Please review your assigned action items and reach out if you have any questions.",
-            "",
-            "Best regards,",
-            "",
-            "[Your Name]"
-        ])
-        
-        return "\n".join(lines)
+            yield f"{status}{item.description}{assignee}{due}"
+        
+        yield ""
+        yield "Please review your assigned action items and reach out if you have any questions."
+        yield ""
+        yield "Best regards,"
+        yield ""
+        yield "[Your Name]"
 
 
 # =============================================================================
@@ -821,13 +1074,17 @@ class MeetingPipeline:
         result = pipeline.process(meeting_notes_text)
     """
     
+    # Worker threads for the file-writing generators
+    MAX_WORKERS = 3
+    
     def __init__(
         self,
         output_dir: Path,
         calendar_generator: Optional[CalendarGenerator] = None,
         task_generator: Optional[TaskListGenerator] = None,
         folder_generator: Optional[FolderGenerator] = None,
-        email_generator: Optional[EmailDraftGenerator] = None
+        email_generator: Optional[EmailDraftGenerator] = None,
+        in_memory: bool = False
     ) -> None:
         """
         Initialize the pipeline with output directory and optional generators.
@@ -838,13 +1095,28 @@ class MeetingPipeline:
             task_generator: Optional custom task list generator
             folder_generator: Optional custom folder generator
             email_generator: Optional custom email generator
+            in_memory: Return the calendar and task list as strings instead
+                of writing files; no folder structure is created. Generators
+                without a matching render() are run into a temporary file
         """
         self.output_dir = Path(output_dir)
+        self.in_memory = in_memory
         self.parser = MeetingParser()
         self.calendar_generator = calendar_generator or CalendarGenerator()
         self.task_generator = task_generator or TaskListGenerator()
         self.folder_generator = folder_generator or FolderGenerator()
         self.email_generator = email_generator or EmailDraftGenerator()
+        
+        # Injected generators may not take the shared ``now`` timestamp;
+        # check once here so process() only passes it where it is accepted
+        self._calendar_takes_now = _accepts_keyword(self.calendar_generator.generate, "now")
+        self._folder_takes_now = _accepts_keyword(self.folder_generator.generate, "now")
+        self._calendar_render = _own_render(self.calendar_generator, CalendarGenerator)
+        self._calendar_render_takes_now = (
+            self._calendar_render is not None
+            and _accepts_keyword(self._calendar_render, "now")
+        )
+        self._task_render = _own_render(self.task_generator, TaskListGenerator)
     
     def process(
         self,
@@ -876,25 +1148,98 @@ class MeetingPipeline:
         if not notes or not notes.strip():
             raise ValidationError("Meeting notes cannot be empty")
         
+        # One timestamp for the whole run, shared by the parser and generators
+        now = datetime.now()
+        
         # Parse meeting
-        meeting = self.parser.parse(notes)
+        meeting = self.parser.parse(notes, now)
+        
+        if self.in_memory:
+            return self._process_in_memory(
+                meeting, now, generate_calendar, generate_task_list, generate_emails
+            )
         
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         output = PipelineOutput(meeting=meeting)
         
-        # Generate artifacts
+        # Generate artifacts. The file-writing generators are independent, so
+        # they run on worker threads while the emails are built on this one.
+        now_kwargs: dict[str, Any] = {"now": now}
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            calendar_future: Optional[Future[Path]] = None
+            task_list_future: Optional[Future[Path]] = None
+            folder_future: Optional[Future[Path]] = None
+            
+            if generate_calendar:
+                calendar_path = self.output_dir / f"{self._safe_filename(meeting.title)}.ics"
+                calendar_future = executor.submit(
+                    self.calendar_generator.generate,
+                    meeting,
+                    calendar_path,
+                    **(now_kwargs if self._calendar_takes_now else {})
+                )
+            
+            if generate_task_list:
+                task_path = self.output_dir / f"{self._safe_filename(meeting.title)}_tasks.md"
+                task_list_future = executor.submit(
+                    self.task_generator.generate, meeting, task_path
+                )
+            
+            if generate_folder:
+                folder_future = executor.submit(
+                    self.folder_generator.generate,
+                    meeting,
+                    self.output_dir,
+                    **(now_kwargs if self._folder_takes_now else {})
+                )
+            
+            if generate_emails:
+                output.email_drafts = self.email_generator.generate(meeting)
+            
+            # Collect in the original order so the first failure is re-raised
+            if calendar_future is not None:
+                output.calendar_path = calendar_future.result()
+            if task_list_future is not None:
+                output.task_list_path = task_list_future.result()
+            if folder_future is not None:
+                output.folder_path = folder_future.result()
+        
+        return output
+    
+    def _process_in_memory(
+        self,
+        meeting: Meeting,
+        now: datetime,
+        generate_calendar: bool,
+        generate_task_list: bool,
+        generate_emails: bool
+    ) -> PipelineOutput:
+        """Build the text artifacts without writing to the output directory."""
+        output = PipelineOutput(meeting=meeting)
+        now_kwargs: dict[str, Any] = {"now": now}
+        
         if generate_calendar:
-            calendar_path = self.output_dir / f"{self._safe_filename(meeting.title)}.ics"
-            output.calendar_path = self.calendar_generator.generate(meeting, calendar_path)
+            if self._calendar_render is not None:
+                output.calendar_content = self._calendar_render(
+                    meeting, **(now_kwargs if self._calendar_render_takes_now else {})
+                )
+            else:
+                output.calendar_content = _render_via_generate(
+                    self.calendar_generator.generate,
+                    meeting,
+                    ".ics",
+                    **(now_kwargs if self._calendar_takes_now else {})
+                )
         
         if generate_task_list:
-            task_path = self.output_dir / f"{self._safe_filename(meeting.title)}_tasks.md"
-            output.task_list_path = self.task_generator.generate(meeting, task_path)
-        
-        if generate_folder:
-            output.folder_path = self.folder_generator.generate(meeting, self.output_dir)
+            if self._task_render is not None:
+                output.task_list_content = self._task_render(meeting)
+            else:
+                output.task_list_content = _render_via_generate(
+                    self.task_generator.generate, meeting, ".md"
+                )
         
         if generate_emails:
             output.email_drafts = self.email_generator.generate(meeting)
@@ -903,19 +1248,57 @@ class MeetingPipeline:
     
     def _safe_filename(self, title: str) -> str:
         """Convert title to safe filename."""
-        safe = re.sub(r'[<>:"/\\|?*]', "-", title)
-        safe = re.sub(r'\s+', "_", safe)
-        return safe.strip("._-") or "meeting"
+        return _sanitize_name(title) or "meeting"
 
 
 # =============================================================================
 # CLI Entry Point
 # =============================================================================
 
-def main() -> None:
-    """CLI entry point for the meeting pipeline."""
-    import argparse
-    
+def _decode_notes(data: bytes) -> str:
+    """Decode UTF-8 notes, normalizing line endings like text-mode reads do."""
+    notes = data.decode("utf-8")
+    if "\r" in notes:
+        notes = notes.replace("\r\n", "\n").replace("\r", "\n")
+    return notes
+
+
+def _read_notes_file(path: str) -> str:
+    """Read a notes file in one sized read, then read on until EOF."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = [os.read(fd, size + 1)]
+        # A read may return short of the size (signals, network filesystems),
+        # and the file may have grown or be a pipe with no size; only an
+        # empty read means EOF
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+    finally:
+        os.close(fd)
+    return _decode_notes(b"".join(chunks))
+
+
+_CLI_FLAGS = {
+    "--no-calendar": "no_calendar",
+    "--no-tasks": "no_tasks",
+    "--no-folder": "no_folder",
+    "--no-emails": "no_emails",
+}
+
+
+class _CliArgs(TypedDict):
+    """Parsed CLI arguments, keyed like argparse's namespace."""
+    input: str
+    output: str
+    no_calendar: bool
+    no_tasks: bool
+    no_folder: bool
+    no_emails: bool
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build the full argparse parser, used for --help and usage errors."""
     parser = argparse.ArgumentParser(
         description="Transform meeting notes into project artifacts"
     )
@@ -948,24 +1331,73 @@ def main() -> None:
         action="store_true",
         help="Skip email draft generation"
     )
+    return parser
+
+
+def _parse_cli_args(argv: list[str]) -> _CliArgs:
+    """
+    Parse CLI arguments without building an argparse parser on the common path.
+    
+    Anything the fast loop does not recognize (--help, unknown or
+    abbreviated flags, a missing input) is handed to argparse, so help
+    text and usage errors are unchanged.
+    """
+    input_path: Optional[str] = None
+    output = "./meeting-output"
+    flags = dict.fromkeys(_CLI_FLAGS.values(), False)
+    
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in _CLI_FLAGS:
+            flags[_CLI_FLAGS[arg]] = True
+        elif arg in ("-o", "--output") and i + 1 < len(argv) and (
+            argv[i + 1] == "-" or not argv[i + 1].startswith("-")
+        ):
+            i += 1
+            output = argv[i]
+        elif arg.startswith("--output="):
+            output = arg[len("--output="):]
+        elif (arg == "-" or not arg.startswith("-")) and input_path is None:
+            input_path = arg
+        else:
+            break
+        i += 1
+    else:
+        if input_path is not None:
+            return _CliArgs(
+                input=input_path,
+                output=output,
+                no_calendar=flags["no_calendar"],
+                no_tasks=flags["no_tasks"],
+                no_folder=flags["no_folder"],
+                no_emails=flags["no_emails"],
+            )
+    
+    return cast(_CliArgs, vars(_build_arg_parser().parse_args(argv)))
+
+
+def main() -> None:
+    """CLI entry point for the meeting pipeline."""
+    import sys
     
-    args = parser.parse_args()
+    args = _parse_cli_args(sys.argv[1:])
     
     # Read input
-    if args.input == "-":
-        import sys
-        notes = sys.stdin.read()
+    if args["input"] == "-":
+        # Decode once instead of going through the text-mode stdin wrapper
+        notes = _decode_notes(sys.stdin.buffer.read())
     else:
-        notes = Path(args.input).read_text(encoding="utf-8")
+        notes = _read_notes_file(args["input"])
     
     # Run pipeline
-    pipeline = MeetingPipeline(output_dir=Path(args.output))
+    pipeline = MeetingPipeline(output_dir=Path(args["output"]))
     result = pipeline.process(
         notes=notes,
-        generate_calendar=not args.no_calendar,
-        generate_task_list=not args.no_tasks,
-        generate_folder=not args.no_folder,
-        generate_emails=not args.no_emails
+        generate_calendar=not args["no_calendar"],
+        generate_task_list=not args["no_tasks"],
+        generate_folder=not args["no_folder"],
+        generate_emails=not args["no_emails"]
     )
     
     # Report results
@@ -18,7 +18,9 @@ from calendar_generator import (
     create_calendar_event,
     create_calendar_from_meeting,
     generate_meeting_invite,
+    save_ics_batch,
     save_ics_to_file,
+    _DEFAULT_GENERATOR,
     _parse_datetime,
     DEFAULT_TIMEZONE,
     DEFAULT_ORGANIZER_NAME,
@@ -51,8 +53,9 @@ class TestCalendarEvent:
         assert event.location == "Room A"
         assert event.duration_minutes == 60
 
-        # Should auto-generate UUID
-        assert UUID(event.uid)
+        # Should auto-generate a canonical version 4 UUID
+        assert UUID(event.uid).version == 4
+        assert str(UUID(event.uid)) == event.uid
 
     def test_end_time_before_start_raises_error(self) -> None:
         """Test that end time must be after start time."""
@@ -140,12 +143,12 @@ class TestICSGenerator:
         assert "LOCATION:" in ics
 
     def test_timezone_block(self, generator: ICSGenerator, sample_event: CalendarEvent) -> None:
-        """Test that ICS output includes timezone definition."""
+        """Test that all-UTC output carries no unreferenced timezone definition."""
         ics = generator.generate(sample_event)
 
-        assert "BEGIN:VTIMEZONE" in ics
-        assert "TZID:Asia/Kolkata" in ics
-        assert "END:VTIMEZONE" in ics
+        assert "BEGIN:VTIMEZONE" not in ics
+        assert "TZID" not in ics
+        assert re.search(r"^DTSTART:\d{8}T\d{6}Z\r$", ics, re.MULTILINE)
 
     def test_attendees_included(self, generator: ICSGenerator, sample_event: CalendarEvent) -> None:
         """Test that attendees are included in ICS output."""
@@ -164,6 +167,19 @@ class TestICSGenerator:
         assert f'CN="{DEFAULT_ORGANIZER_NAME}"' in ics or f"CN={DEFAULT_ORGANIZER_NAME}" in ics
         assert f"mailto:{DEFAULT_ORGANIZER_EMAIL}" in ics
 
+    def test_organizer_name_quotes_escaped(self, generator: ICSGenerator) -> None:
+        """Test CN uses RFC 6868 caret encoding, so a quote cannot close the value."""
+        event = CalendarEvent(
+            title="Test",
+            start_time=datetime(2024, 3, 15, 10, 0),
+            end_time=datetime(2024, 3, 15, 11, 0),
+            organizer_name='Ann "The Boss" ^ C:\\x\r\nOps\x00',
+        )
+
+        ics = generator.generate(event)
+
+        assert 'ORGANIZER;CN="Ann ^\'The Boss^\' ^^ C:\\x^nOps":mailto:' in ics
+
     def test_text_escaping(self, generator: ICSGenerator) -> None:
         """Test special character escaping in text values."""
         event = CalendarEvent(
@@ -180,6 +196,24 @@ class TestICSGenerator:
         assert r"\;" in ics or "Meeting;" in ics
         assert "\\n" in ics
 
+    def test_datetime_formats(self, generator: ICSGenerator) -> None:
+        """Test basic-format date/time output, including zero padding."""
+        dt = datetime(987, 3, 5, 4, 7, 9)
+
+        assert generator._format_datetime(dt) == "09870305T040709Z"
+        assert generator._format_datetime_local(dt) == "09870305T040709"
+        assert generator._format_date(dt) == "09870305"
+
+    def test_escape_text_exact(self, generator: ICSGenerator) -> None:
+        """Test every RFC 5545 special character is escaped exactly once."""
+        assert generator._escape_text("a\\b;c,d\r\ne") == "a\\\\b\\;c\\,d\\ne"
+        assert generator._escape_text("") == ""
+
+    def test_escape_text_plain_returns_input(self, generator: ICSGenerator) -> None:
+        """Test text without special characters is returned unchanged."""
+        text = "Conference Room A"
+        assert generator._escape_text(text) is text
+
     def test_line_folding(self, generator: ICSGenerator) -> None:
         """Test that long lines are properly folded."""
         event = CalendarEvent(
@@ -198,6 +232,22 @@ class TestICSGenerator:
             if line:
                 assert len(line) <= 75, f"Line too long: {line[:80]}..."
 
+    def test_fold_line_round_trips(self, generator: ICSGenerator) -> None:
+        """Test unfolding a folded line restores the original text."""
+        line = "DESCRIPTION:" + "x" * 1000
+        folded = generator._fold_line(line)
+
+        assert folded.replace("\r\n ", "") == line
+        assert all(len(part) <= 75 for part in folded.split("\r\n"))
+
+    def test_fold_line_counts_octets(self, generator: ICSGenerator) -> None:
+        """Test multi-byte text folds at 75 octets without splitting characters."""
+        line = "SUMMARY:" + "Zoë ☕ " * 40
+        folded = generator._fold_line(line)
+
+        assert folded.replace("\r\n ", "") == line
+        assert all(len(part.encode("utf-8")) <= 75 for part in folded.split("\r\n"))
+
     def test_crlf_line_endings(self, generator: ICSGenerator, sample_event: CalendarEvent) -> None:
         """Test that output uses CRLF line endings."""
         ics = generator.generate(sample_event)
@@ -227,6 +277,92 @@ class TestICSGenerator:
         assert ics.count("END:VCALENDAR") == 1
         assert ics.count("BEGIN:VEVENT") == 3
         assert ics.count("END:VEVENT") == 3
+        assert ics.count("ATTENDEE;ROLE=REQ-PARTICIPANT;RSVP=TRUE:mailto:user@example.com") == 3
+        assert generator.last_event_count == 3
+
+    def test_batch_shares_last_modified(self, generator: ICSGenerator) -> None:
+        """Test all events in a batch get the same LAST-MODIFIED stamp."""
+        events = [
+            CalendarEvent(
+                title=f"Event {i}",
+                start_time=datetime(2024, 3, 15, 10 + i, 0),
+                end_time=datetime(2024, 3, 15, 11 + i, 0),
+            )
+            for i in range(3)
+        ]
+
+        ics = generator.generate_batch(events)
+
+        assert len(set(re.findall(r"LAST-MODIFIED:(\S+)", ics))) == 1
+
+    def test_generate_for_slots(self, generator: ICSGenerator, sample_event: CalendarEvent) -> None:
+        """Test one calendar per slot sharing attendees but with unique UIDs."""
+        slots = [
+            (datetime(2024, 3, 15, 10, 0), datetime(2024, 3, 15, 11, 0)),
+            (datetime(2024, 3, 15, 14, 0), datetime(2024, 3, 15, 15, 0)),
+        ]
+
+        ics_list = generator.generate_for_slots(sample_event, slots, titles=["A", "B"])
+
+        assert len(ics_list) == 2
+        assert "SUMMARY:B" in ics_list[1]
+        assert "DTSTART:20240315T140000Z" in ics_list[1]
+        assert all("mailto:alice@example.com" in ics for ics in ics_list)
+        uids = {re.search(r"UID:(\S+)", ics).group(1) for ics in ics_list}
+        assert len(uids) == 2
+        assert generator.last_event_count == 2
+
+    def test_generate_for_slots_invalid_slot_raises(
+        self, generator: ICSGenerator, sample_event: CalendarEvent
+    ) -> None:
+        """Test that a slot ending before it starts raises error."""
+        slots = [(datetime(2024, 3, 15, 11, 0), datetime(2024, 3, 15, 10, 0))]
+        with pytest.raises(ValueError, match="End time must be after start time"):
+            generator.generate_for_slots(sample_event, slots)
+
+    def test_write_events(self, generator: ICSGenerator, tmp_path: Path) -> None:
+        """Test each event is written to its own file, in input order."""
+        events = [
+            CalendarEvent(
+                title=f"Event {i}",
+                start_time=datetime(2024, 3, 15, 10 + i, 0),
+                end_time=datetime(2024, 3, 15, 11 + i, 0),
+            )
+            for i in range(3)
+        ]
+
+        paths = generator.write_events(events, tmp_path / "out")
+
+        assert [p.name for p in paths] == ["event_1.ics", "event_2.ics", "event_3.ics"]
+        assert "SUMMARY:Event 2" in paths[2].read_bytes().decode("utf-8")
+        assert paths[0].read_bytes().endswith(b"END:VCALENDAR\r\n")
+
+    def test_write_events_custom_names(self, generator: ICSGenerator, tmp_path: Path) -> None:
+        """Test name_fn chooses the filename from the event and its index."""
+        event = CalendarEvent(
+            title="Standup",
+            start_time=datetime(2024, 3, 15, 10, 0),
+            end_time=datetime(2024, 3, 15, 11, 0),
+        )
+
+        paths = generator.write_events([event], tmp_path, lambda e, i: f"{e.title}-{i}.ics")
+
+        assert paths == [tmp_path / "Standup-0.ics"]
+
+    def test_write_events_leaves_event_count(
+        self, generator: ICSGenerator, tmp_path: Path
+    ) -> None:
+        """Test the write_events threads don't race on last_event_count."""
+        event = CalendarEvent(
+            title="Standup",
+            start_time=datetime(2024, 3, 15, 10, 0),
+            end_time=datetime(2024, 3, 15, 11, 0),
+        )
+        generator.generate_batch([event, event])
+
+        generator.write_events([event] * 4, tmp_path)
+
+        assert generator.last_event_count == 2
 
     def test_batch_generation_empty_raises(self, generator: ICSGenerator) -> None:
         """Test that empty event list raises error."""
@@ -257,6 +393,19 @@ class TestCreateCalendarEvent:
         assert "DESCRIPTION:Test description" in ics
         assert "LOCATION:Room A" in ics
 
+    def test_custom_generator(self) -> None:
+        """Test a caller-supplied generator is used for rendering."""
+        ics = create_calendar_event(
+            title="Test Meeting",
+            start_time=datetime(2024, 3, 15, 10, 0),
+            end_time=datetime(2024, 3, 15, 11, 0),
+            attendees=[],
+            description="",
+            generator=ICSGenerator(prod_id="-//Custom//EN"),
+        )
+
+        assert "PRODID:-//Custom//EN" in ics
+
     def test_aware_datetimes(self) -> None:
         """Test with timezone-aware datetimes."""
         ist = timezone(timedelta(hours=5, minutes=30))
@@ -328,11 +477,34 @@ class TestCreateCalendarFromMeeting:
         assert len(ics_list) == 1
         assert "Sprint Planning" in ics_list[0]
         assert "plan the sprint" in ics_list[0].lower()
+        # Newlines are escaped exactly once, not doubled
+        assert "DESCRIPTION:From: Q1 Planning\\n\\nPlan the sprint" in ics_list[0]
         # Should include both event attendees and participants
         assert "dev@example.com" in ics_list[0]
         assert "pm@example.com" in ics_list[0]
         assert "stakeholder@example.com" in ics_list[0]
 
+    def test_attendees_deduplicated_in_order(self) -> None:
+        """Test event attendees come first, then participants, without repeats."""
+        meeting_data = {
+            "events": [
+                {
+                    "title": "Sync",
+                    "start_time": "2024-03-15T10:00:00",
+                    "attendees": ["b@example.com", "a@example.com"],
+                }
+            ],
+            "participants": ["a@example.com", "c@example.com"],
+        }
+
+        ics = create_calendar_from_meeting(meeting_data)[0]
+
+        assert re.findall(r"ATTENDEE;[^:]*:mailto:(\S+)", ics) == [
+            "b@example.com",
+            "a@example.com",
+            "c@example.com",
+        ]
+
     def test_multiple_events(self) -> None:
         """Test parsing multiple events from meeting data."""
         meeting_data = {
@@ -360,6 +532,22 @@ class TestCreateCalendarFromMeeting:
         assert "Event 1" in ics_list[0]
         assert "Event 2" in ics_list[1]
 
+    def test_multiple_events_batch(self) -> None:
+        """Test batch mode puts every event in one calendar."""
+        meeting_data = {
+            "events": [
+                {"title": "Event 1", "start_time": "2024-03-15T10:00:00"},
+                {"title": "Event 2", "start_time": "2024-03-15T14:00:00"},
+            ]
+        }
+
+        ics_list = create_calendar_from_meeting(meeting_data, batch=True)
+
+        assert len(ics_list) == 1
+        assert ics_list[0].count("BEGIN:VCALENDAR") == 1
+        assert ics_list[0].count("BEGIN:VEVENT") == 2
+        assert "METHOD:PUBLISH" in ics_list[0]
+
     def test_using_duration_instead_of_end_time(self) -> None:
         """Test that duration_minutes can be used instead of end_time."""
         meeting_data = {
@@ -454,6 +642,11 @@ class TestParseDatetime:
         assert dt.year == 2024
         assert dt.hour == 10
 
+    def test_with_utc_designator(self) -> None:
+        """Test a trailing "Z" parses as UTC (fromisoformat rejects it before 3.11)."""
+        dt = _parse_datetime("2024-03-15T10:00:00Z")
+        assert dt == datetime(2024, 3, 15, 10, 0, tzinfo=timezone.utc)
+
     def test_with_colon_in_timezone(self) -> None:
         """Test parsing datetime with colon in timezone."""
         dt = _parse_datetime("2024-03-15T10:00:00+05:30")
@@ -479,10 +672,8 @@ class TestSaveIcsToFile:
         result = save_ics_to_file(ics_content, tmp_path, "test.ics")
 
         assert result.exists()
-        # On POSIX, write_text may normalize line endings to LF
-        saved_content = result.read_text()
-        assert "BEGIN:VCALENDAR" in saved_content
-        assert "END:VCALENDAR" in saved_content
+        # Written byte for byte, CRLF line endings included
+        assert result.read_bytes() == ics_content.encode("utf-8")
 
     def test_save_with_full_path(self, tmp_path: Path) -> None:
         """Test saving with full file path."""
@@ -492,10 +683,7 @@ class TestSaveIcsToFile:
 
         assert result == full_path
         assert result.exists()
-        # On POSIX, write_text may normalize line endings to LF
-        saved_content = result.read_text()
-        assert "BEGIN:VCALENDAR" in saved_content
-        assert "END:VCALENDAR" in saved_content
+        assert result.read_bytes() == ics_content.encode("utf-8")
 
     def test_directory_without_filename_raises(self, tmp_path: Path) -> None:
         """Test that directory path without filename raises error."""
@@ -513,6 +701,30 @@ class TestSaveIcsToFile:
         assert result.name == "deep.ics"
 
 
+class TestSaveIcsBatch:
+    """Tests for save_ics_batch function."""
+
+    def test_default_filenames(self, tmp_path: Path) -> None:
+        """Test contents are saved as event_N.ics with CRLF preserved."""
+        contents = ["BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n", "BEGIN:VCALENDAR\r\n"]
+        paths = save_ics_batch(contents, tmp_path / "out")
+
+        assert [p.name for p in paths] == ["event_1.ics", "event_2.ics"]
+        assert paths[0].read_bytes() == contents[0].encode()
+
+    def test_parallel_writes_keep_order(self, tmp_path: Path) -> None:
+        """Test max_workers writes every file and returns paths in input order."""
+        contents = [f"BEGIN:VCALENDAR\r\nX-N:{i}\r\n" for i in range(5)]
+        paths = save_ics_batch(contents, tmp_path, max_workers=4)
+
+        assert [p.read_bytes().decode() for p in paths] == contents
+
+    def test_filename_count_mismatch_raises(self, tmp_path: Path) -> None:
+        """Test that a wrong number of filenames raises error."""
+        with pytest.raises(ValueError, match="filenames"):
+            save_ics_batch(["a", "b"], tmp_path, ["only-one.ics"])
+
+
 class TestGenerateMeetingInvite:
     """Tests for generate_meeting_invite function."""
 
@@ -553,6 +765,14 @@ class TestGenerateMeetingInvite:
             assert f"Client Meeting (Option {i})" in ics
             assert f"(Option {i} of 3)" in ics
 
+    def test_shared_generator_keeps_no_count(self) -> None:
+        """Test the module helpers never write state on the shared generator."""
+        slots = [(datetime(2024, 3, 15, 10, 0), datetime(2024, 3, 15, 11, 0))] * 2
+
+        generate_meeting_invite("Sync", slots, ["team@example.com"])
+
+        assert _DEFAULT_GENERATOR.last_event_count == 0
+
 
 class TestIntegration:
     """Integration tests for complete workflow."""
@@ -595,9 +815,8 @@ class TestIntegration:
 
         # Verify files
         assert all(p.exists() for p in saved_paths)
-        # Note: On POSIX, write_text normalizes CRLF to LF, so we check content presence instead
-        assert "BEGIN:VCALENDAR" in (output_dir / "event_1.ics").read_text()
-        assert "BEGIN:VCALENDAR" in (output_dir / "event_2.ics").read_text()
+        assert (output_dir / "event_1.ics").read_bytes() == ics_list[0].encode("utf-8")
+        assert (output_dir / "event_2.ics").read_bytes() == ics_list[1].encode("utf-8")
 
         # Validate content
         content1 = ics_list[0]
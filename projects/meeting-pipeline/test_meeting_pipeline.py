@@ -12,10 +12,14 @@ Tests cover:
 
 from __future__ import annotations
 
-import unittest
-import tempfile
-from datetime import datetime
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import pytest
 
 from meeting_pipeline import (
     # Exceptions
@@ -28,7 +32,9 @@ from meeting_pipeline import (
     Attendee,
     ActionItem,
     Decision,
+    EmailDrafts,
     Meeting,
+    PipelineOutput,
     Priority,
     # Generators
     MeetingParser,
@@ -37,6 +43,12 @@ from meeting_pipeline import (
     FolderGenerator,
     EmailDraftGenerator,
     MeetingPipeline,
+    # Generator helpers
+    _format_date,
+    # CLI helpers
+    _build_arg_parser,
+    _parse_cli_args,
+    _read_notes_file,
 )
 
 
@@ -107,179 +119,255 @@ Decisions:
 """
 
 
+# Shared immutable values for hand-built Meeting fixtures
+_FIXED_DATE = datetime(2026, 2, 17)
+_FIXED_DUE_DATE = datetime(2026, 2, 20)
+_ALICE = Attendee(name="Alice")
+_BOB = Attendee(name="Bob")
+
+
+def _lower_blob(texts: Iterable[str]) -> str:
+    """Join texts into one lowercased, newline-separated string to search."""
+    return "\n".join(texts).lower()
+
+
 # =============================================================================
 # MeetingParser Tests
 # =============================================================================
 
-class TestMeetingParser(unittest.TestCase):
+@pytest.fixture(scope="module")
+def parser() -> MeetingParser:
+    """Share one parser across the module; it holds no per-parse state."""
+    return MeetingParser(default_year=2026)
+
+
+@pytest.fixture(scope="module")
+def parsed_sample(parser: MeetingParser) -> Meeting:
+    """SAMPLE_MEETING_NOTES parsed once; tests treat it as read-only."""
+    return parser.parse(SAMPLE_MEETING_NOTES)
+
+
+@pytest.fixture(scope="module")
+def parsed_complex(parser: MeetingParser) -> Meeting:
+    """COMPLEX_MEETING parsed once; tests treat it as read-only."""
+    return parser.parse(COMPLEX_MEETING)
+
+
+class TestMeetingParser:
     """Tests for the MeetingParser class."""
     
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.parser = MeetingParser(default_year=2026)
-    
-    def test_parse_basic_meeting(self) -> None:
+    def test_parse_basic_meeting(self, parsed_sample: Meeting) -> None:
         """Test parsing a basic meeting note."""
-        meeting = self.parser.parse(SAMPLE_MEETING_NOTES)
+        meeting = parsed_sample
         
-        self.assertEqual(meeting.title, "Q1 Planning")
-        self.assertEqual(meeting.date.month, 2)
-        self.assertEqual(meeting.date.day, 17)
-        self.assertEqual(meeting.date.year, 2026)
+        assert meeting.title == "Q1 Planning"
+        assert meeting.date.month == 2
+        assert meeting.date.day == 17
+        assert meeting.date.year == 2026
     
-    def test_parse_attendees(self) -> None:
+    def test_parse_attendees(self, parsed_sample: Meeting) -> None:
         """Test attendee extraction."""
-        meeting = self.parser.parse(SAMPLE_MEETING_NOTES)
+        meeting = parsed_sample
         
-        self.assertEqual(len(meeting.attendees), 3)
+        assert len(meeting.attendees) == 3
         attendee_names = [a.name for a in meeting.attendees]
-        self.assertIn("Alice", attendee_names)
-        self.assertIn("Bob", attendee_names)
-        self.assertIn("Charlie", attendee_names)
+        assert "Alice" in attendee_names
+        assert "Bob" in attendee_names
+        assert "Charlie" in attendee_names
     
-    def test_parse_discussion_points(self) -> None:
+    def test_attendees_shared_across_parses(self, parser: MeetingParser) -> None:
+        """Test the same attendee name yields one shared Attendee instance."""
+        first = parser.parse(SAMPLE_MEETING_NOTES).attendees
+        second = parser.parse(SAMPLE_MEETING_NOTES).attendees
+        
+        assert first == second
+        assert all(a is b for a, b in zip(first, second))
+    
+    def test_parse_discussion_points(self, parsed_sample: Meeting) -> None:
         """Test discussion point extraction."""
-        meeting = self.parser.parse(SAMPLE_MEETING_NOTES)
+        meeting = parsed_sample
         
-        self.assertGreaterEqual(len(meeting.discussion_points), 4)
+        assert len(meeting.discussion_points) >= 4
         # Check that specific points were captured
-        point_texts = [p.lower() for p in meeting.discussion_points]
-        self.assertTrue(
-            any("api integration" in p for p in point_texts)
-        )
+        assert "api integration" in _lower_blob(meeting.discussion_points)
     
-    def test_parse_action_items(self) -> None:
+    def test_parse_action_items(self, parsed_sample: Meeting) -> None:
         """Test action item extraction."""
-        meeting = self.parser.parse(SAMPLE_MEETING_NOTES)
+        meeting = parsed_sample
         
-        self.assertGreaterEqual(len(meeting.action_items), 3)
+        assert len(meeting.action_items) >= 3
         
         # Check for specific action items
-        descriptions = [i.description.lower() for i in meeting.action_items]
-        self.assertTrue(any("api integration" in d for d in descriptions))
-        self.assertTrue(any("documentation" in d for d in descriptions))
+        descriptions = _lower_blob(i.description for i in meeting.action_items)
+        assert "api integration" in descriptions
+        assert "documentation" in descriptions
     
-    def test_parse_action_item_assignees(self) -> None:
+    def test_parse_action_item_assignees(self, parsed_sample: Meeting) -> None:
         """Test action item assignee extraction."""
-        meeting = self.parser.parse(SAMPLE_MEETING_NOTES)
+        meeting = parsed_sample
         
-        bob_items = [i for i in meeting.action_items if i.assignee == "Bob"]
-        alice_items = [i for i in meeting.action_items if i.assignee == "Alice"]
+        by_assignee: defaultdict[Optional[str], list[ActionItem]] = defaultdict(list)
+        for item in meeting.action_items:
+            by_assignee[item.assignee].append(item)
         
-        self.assertGreaterEqual(len(bob_items), 2)
-        self.assertGreaterEqual(len(alice_items), 1)
+        assert len(by_assignee["Bob"]) >= 2
+        assert len(by_assignee["Alice"]) >= 1
     
-    def test_parse_action_item_due_dates(self) -> None:
+    def test_parse_action_item_due_dates(self, parsed_sample: Meeting) -> None:
         """Test due date extraction from action items."""
-        meeting = self.parser.parse(SAMPLE_MEETING_NOTES)
+        meeting = parsed_sample
         
         items_with_dates = [i for i in meeting.action_items if i.due_date]
-        self.assertGreaterEqual(len(items_with_dates), 3)
+        assert len(items_with_dates) >= 3
         
         # Check specific due date
         api_item = next(
             (i for i in meeting.action_items if "API integration" in i.description),
             None
         )
-        self.assertIsNotNone(api_item)
-        self.assertIsNotNone(api_item.due_date)
-        self.assertEqual(api_item.due_date.day, 20)
-        self.assertEqual(api_item.due_date.month, 2)
+        assert api_item is not None
+        assert api_item.due_date is not None
+        assert api_item.due_date.day == 20
+        assert api_item.due_date.month == 2
+    
+    def test_parse_action_item_separators(self, parser: MeetingParser) -> None:
+        """Test hyphenated descriptions and en-dash separators."""
+        notes = (
+            "Meeting: Sync\n"
+            "Action Items:\n"
+            "- [x] Review well-known issue – Carol – Due Mar 5\n"
+        )
+        item = parser.parse(notes).action_items[0]
+        
+        assert item.description == "Review well-known issue"
+        assert item.assignee == "Carol"
+        assert item.completed
+        assert (item.due_date.month, item.due_date.day) == (3, 5)
     
-    def test_parse_decisions(self) -> None:
+    def test_parse_long_action_item_line(self, parser: MeetingParser) -> None:
+        """Test a very long, separator-heavy action item parses correctly."""
+        description = " - ".join(["step"] * 20000)
+        notes = (
+            "Meeting: Sync\n"
+            "Action Items:\n"
+            f"- [ ] {description} - Bob - Due Mar 5\n"
+        )
+        item = parser.parse(notes).action_items[0]
+        
+        assert item.description == description
+        assert item.assignee == "Bob"
+        assert (item.due_date.month, item.due_date.day) == (3, 5)
+    
+    def test_parse_action_item_long_whitespace_run(self, parser: MeetingParser) -> None:
+        """Test a long run of spaces inside an action item parses in linear time."""
+        description = "Write" + " " * 20000 + "docs"
+        notes = (
+            "Meeting: Sync\n"
+            "Action Items:\n"
+            f"- [ ] {description} - Bob\n"
+        )
+        item = parser.parse(notes).action_items[0]
+        
+        assert item.description == description
+        assert item.assignee == "Bob"
+    
+    def test_parse_decisions(self, parsed_sample: Meeting) -> None:
         """Test decision extraction."""
-        meeting = self.parser.parse(SAMPLE_MEETING_NOTES)
+        meeting = parsed_sample
         
-        self.assertGreaterEqual(len(meeting.decisions), 1)
-        decision_texts = [d.description.lower() for d in meeting.decisions]
-        self.assertTrue(any("budget" in t for t in decision_texts))
+        assert len(meeting.decisions) >= 1
+        assert "budget" in _lower_blob(d.description for d in meeting.decisions)
     
-    def test_parse_complex_meeting(self) -> None:
+    def test_parse_complex_meeting(self, parsed_complex: Meeting) -> None:
         """Test parsing a complex meeting with many elements."""
-        meeting = self.parser.parse(COMPLEX_MEETING)
+        meeting = parsed_complex
         
-        self.assertEqual(meeting.title, "Product Strategy Review - Q1 2026")
-        self.assertEqual(len(meeting.attendees), 4)
-        self.assertGreaterEqual(len(meeting.action_items), 5)
-        self.assertGreaterEqual(len(meeting.decisions), 3)
+        assert meeting.title == "Product Strategy Review - Q1 2026"
+        assert len(meeting.attendees) == 4
+        assert len(meeting.action_items) >= 5
+        assert len(meeting.decisions) >= 3
     
-    def test_parse_empty_notes_raises_error(self) -> None:
+    def test_parse_empty_notes_raises_error(self, parser: MeetingParser) -> None:
         """Test that empty notes raises an error."""
-        with self.assertRaises(MeetingParseError):
-            self.parser.parse("")
+        with pytest.raises(MeetingParseError):
+            parser.parse("")
         
-        with self.assertRaises(MeetingParseError):
-            self.parser.parse("   \n\n   ")
+        with pytest.raises(MeetingParseError):
+            parser.parse("   \n\n   ")
     
-    def test_parse_missing_title(self) -> None:
+    def test_parse_missing_title(self, parser: MeetingParser) -> None:
         """Test parsing notes without explicit title."""
         notes = "Date: Feb 17, 2026\nAttendees: Alice"
-        meeting = self.parser.parse(notes)
+        meeting = parser.parse(notes)
         
         # Should use first line as title
-        self.assertIsNotNone(meeting.title)
+        assert meeting.title is not None
     
-    def test_parse_various_date_formats(self) -> None:
-        """Test parsing various date formats."""
-        formats = [
+    @pytest.mark.parametrize(
+        ("date_str", "month", "day", "year"),
+        [
             ("Feb 17, 2026", 2, 17, 2026),
             ("February 17, 2026", 2, 17, 2026),
             ("2026-02-17", 2, 17, 2026),
             ("17 Feb 2026", 2, 17, 2026),
             ("02/17/2026", 2, 17, 2026),
-        ]
+            ("17/02/2026", 2, 17, 2026),
+            ("17 February 2026", 2, 17, 2026),
+        ],
+    )
+    def test_parse_various_date_formats(
+        self, parser: MeetingParser, date_str: str, month: int, day: int, year: int
+    ) -> None:
+        """Test parsing various date formats."""
+        notes = f"Meeting: Test\nDate: {date_str}\nAttendees: Alice"
+        meeting = parser.parse(notes)
         
-        for date_str, month, day, year in formats:
-            notes = f"Meeting: Test\nDate: {date_str}\nAttendees: Alice"
-            meeting = self.parser.parse(notes)
-            self.assertEqual(meeting.date.month, month, f"Failed for: {date_str}")
-            self.assertEqual(meeting.date.day, day, f"Failed for: {date_str}")
-            self.assertEqual(meeting.date.year, year, f"Failed for: {date_str}")
+        assert (meeting.date.year, meeting.date.month, meeting.date.day) == (year, month, day)
 
 
 # =============================================================================
 # Data Model Tests
 # =============================================================================
 
-class TestDataModels(unittest.TestCase):
+class TestDataModels:
     """Tests for data model validation."""
     
     def test_attendee_empty_name_raises(self) -> None:
         """Test that empty attendee name raises ValidationError."""
-        with self.assertRaises(ValidationError):
+        with pytest.raises(ValidationError):
             Attendee(name="")
         
-        with self.assertRaises(ValidationError):
+        with pytest.raises(ValidationError):
             Attendee(name="   ")
     
     def test_attendee_valid_creation(self) -> None:
         """Test valid attendee creation."""
         attendee = Attendee(name="Alice", email="alice@example.com")
-        self.assertEqual(attendee.name, "Alice")
-        self.assertEqual(attendee.email, "alice@example.com")
+        assert attendee.name == "Alice"
+        assert attendee.email == "alice@example.com"
     
     def test_action_item_empty_description_raises(self) -> None:
         """Test that empty action item description raises ValidationError."""
-        with self.assertRaises(ValidationError):
+        with pytest.raises(ValidationError):
             ActionItem(description="")
         
-        with self.assertRaises(ValidationError):
+        with pytest.raises(ValidationError):
             ActionItem(description="   ")
     
     def test_action_item_default_priority(self) -> None:
         """Test action item default priority is MEDIUM."""
         item = ActionItem(description="Test task")
-        self.assertEqual(item.priority, Priority.MEDIUM)
-        self.assertFalse(item.completed)
+        assert item.priority == Priority.MEDIUM
+        assert not item.completed
     
     def test_decision_empty_description_raises(self) -> None:
         """Test that empty decision description raises ValidationError."""
-        with self.assertRaises(ValidationError):
+        with pytest.raises(ValidationError):
             Decision(description="")
     
     def test_meeting_empty_title_raises(self) -> None:
         """Test that empty meeting title raises ValidationError."""
-        with self.assertRaises(ValidationError):
+        with pytest.raises(ValidationError):
             Meeting(title="", date=datetime.now())
 
 
@@ -287,139 +375,171 @@ class TestDataModels(unittest.TestCase):
 # CalendarGenerator Tests
 # =============================================================================
 
-class TestCalendarGenerator(unittest.TestCase):
+class TestCalendarGenerator:
     """Tests for the CalendarGenerator class."""
     
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.generator = CalendarGenerator()
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture
+    def generator(self) -> CalendarGenerator:
+        return CalendarGenerator()
     
-    def tearDown(self) -> None:
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @staticmethod
+    def _generate_and_read(
+        generator: CalendarGenerator, meeting: Meeting, tmp_path: Path
+    ) -> str:
+        """Generate the meeting's file once and return its content."""
+        output_path = tmp_path / "meeting.ics"
+        generator.generate(meeting, output_path)
+        return output_path.read_text()
     
-    def test_generate_ics_file(self) -> None:
+    def test_generate_ics_file(
+        self, generator: CalendarGenerator, tmp_path: Path
+    ) -> None:
         """Test ICS file generation."""
         meeting = Meeting(
             title="Test Meeting",
             date=datetime(2026, 2, 17, 10, 0),
-            attendees=[Attendee(name="Alice")],
+            attendees=[_ALICE],
             action_items=[ActionItem(description="Test task")]
         )
         
-        output_path = Path(self.temp_dir) / "test.ics"
-        result_path = self.generator.generate(meeting, output_path)
+        output_path = tmp_path / "meeting.ics"
+        result_path = generator.generate(meeting, output_path)
         
-        self.assertTrue(result_path.exists())
+        assert result_path.exists()
         content = result_path.read_text()
         
         # Check ICS structure
-        self.assertIn("BEGIN:VCALENDAR", content)
-        self.assertIn("END:VCALENDAR", content)
-        self.assertIn("BEGIN:VEVENT", content)
-        self.assertIn("END:VEVENT", content)
-        self.assertIn("Test Meeting", content)
+        assert "BEGIN:VCALENDAR" in content
+        assert "END:VCALENDAR" in content
+        assert "BEGIN:VEVENT" in content
+        assert "END:VEVENT" in content
+        assert "Test Meeting" in content
     
-    def test_ics_contains_action_items(self) -> None:
+    def test_ics_contains_action_items(
+        self, generator: CalendarGenerator, tmp_path: Path
+    ) -> None:
         """Test that action items are included in ICS description."""
         meeting = Meeting(
             title="Test Meeting",
-            date=datetime(2026, 2, 17),
+            date=_FIXED_DATE,
             action_items=[
                 ActionItem(description="Task 1", assignee="Bob"),
                 ActionItem(description="Task 2", completed=True)
             ]
         )
         
-        output_path = Path(self.temp_dir) / "test.ics"
-        self.generator.generate(meeting, output_path)
-        content = output_path.read_text()
+        content = self._generate_and_read(generator, meeting, tmp_path)
         
-        self.assertIn("Task 1", content)
-        self.assertIn("Task 2", content)
-        self.assertIn("[ ]", content)
-        self.assertIn("[x]", content)
+        assert "Task 1" in content
+        assert "Task 2" in content
+        assert "[ ]" in content
+        assert "[x]" in content
+    
+    def test_ics_description_escaping(self, generator: CalendarGenerator) -> None:
+        """Test RFC 5545 special characters are escaped in the description."""
+        meeting = Meeting(
+            title="Test Meeting",
+            date=_FIXED_DATE,
+            discussion_points=["Costs, risks; and C:\\temp"]
+        )
+        
+        content = generator.render(meeting, 60)
+        description = next(
+            line for line in content.split("\n") if line.startswith("DESCRIPTION:")
+        )
+        
+        assert description == (
+            "DESCRIPTION:Test Meeting\\n\\nDiscussion:\\n- Costs\\, risks\\; and C:\\\\temp"
+        )
     
-    def test_ics_attendees(self) -> None:
+    def test_ics_attendees(self, generator: CalendarGenerator, tmp_path: Path) -> None:
         """Test that attendees are included in ICS."""
         meeting = Meeting(
             title="Test Meeting",
-            date=datetime(2026, 2, 17),
-            attendees=[Attendee(name="Alice"), Attendee(name="Bob")]
+            date=_FIXED_DATE,
+            attendees=[_ALICE, _BOB]
         )
         
-        output_path = Path(self.temp_dir) / "test.ics"
-        self.generator.generate(meeting, output_path)
-        content = output_path.read_text()
+        content = self._generate_and_read(generator, meeting, tmp_path)
         
-        self.assertIn("Alice", content)
-        self.assertIn("Bob", content)
+        assert "Alice" in content
+        assert "Bob" in content
     
-    def test_generate_with_none_meeting_raises(self) -> None:
+    def test_generate_with_none_meeting_raises(
+        self, generator: CalendarGenerator, tmp_path: Path
+    ) -> None:
         """Test that None meeting raises ValidationError."""
-        with self.assertRaises(ValidationError):
-            self.generator.generate(None, Path(self.temp_dir) / "test.ics")
+        with pytest.raises(ValidationError):
+            generator.generate(None, tmp_path / "meeting.ics")
 
 
 # =============================================================================
 # TaskListGenerator Tests
 # =============================================================================
 
-class TestTaskListGenerator(unittest.TestCase):
+class TestTaskListGenerator:
     """Tests for the TaskListGenerator class."""
     
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.generator = TaskListGenerator()
-        self.temp_dir = tempfile.mkdtemp()
+    # Structure and content test_generate_markdown_file expects to find
+    _MARKDOWN_REQUIRED = frozenset({
+        "# Test Meeting",
+        "**Date:** February 17, 2026",
+        "## Discussion Points",
+        "## Action Items",
+        "## Decisions",
+        "## Summary",
+        "Point 1",
+        "Task 1",
+        "Bob",
+        "Due: Feb 20",
+        "Decision 1",
+    })
     
-    def tearDown(self) -> None:
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture
+    def generator(self) -> TaskListGenerator:
+        return TaskListGenerator()
     
-    def test_generate_markdown_file(self) -> None:
+    @staticmethod
+    def _generate_and_read(
+        generator: TaskListGenerator, meeting: Meeting, tmp_path: Path
+    ) -> str:
+        """Generate the meeting's file once and return its content."""
+        output_path = tmp_path / "tasks.md"
+        generator.generate(meeting, output_path)
+        return output_path.read_text()
+    
+    def test_generate_markdown_file(
+        self, generator: TaskListGenerator, tmp_path: Path
+    ) -> None:
         """Test Markdown task list generation."""
         meeting = Meeting(
             title="Test Meeting",
-            date=datetime(2026, 2, 17),
-            attendees=[Attendee(name="Alice")],
+            date=_FIXED_DATE,
+            attendees=[_ALICE],
             discussion_points=["Point 1", "Point 2"],
             action_items=[
-                ActionItem(description="Task 1", assignee="Bob", due_date=datetime(2026, 2, 20)),
+                ActionItem(description="Task 1", assignee="Bob", due_date=_FIXED_DUE_DATE),
                 ActionItem(description="Task 2", completed=True)
             ],
             decisions=[Decision(description="Decision 1")]
         )
         
-        output_path = Path(self.temp_dir) / "tasks.md"
-        result_path = self.generator.generate(meeting, output_path)
+        output_path = tmp_path / "tasks.md"
+        result_path = generator.generate(meeting, output_path)
         
-        self.assertTrue(result_path.exists())
+        assert result_path.exists()
         content = result_path.read_text()
         
-        # Check structure
-        self.assertIn("# Test Meeting", content)
-        self.assertIn("**Date:** February 17, 2026", content)
-        self.assertIn("## Discussion Points", content)
-        self.assertIn("## Action Items", content)
-        self.assertIn("## Decisions", content)
-        self.assertIn("## Summary", content)
-        
-        # Check content
-        self.assertIn("Point 1", content)
-        self.assertIn("Task 1", content)
-        self.assertIn("Bob", content)
-        self.assertIn("Due: Feb 20", content)
-        self.assertIn("Decision 1", content)
-    
-    def test_group_by_assignee(self) -> None:
+        missing = sorted(s for s in self._MARKDOWN_REQUIRED if s not in content)
+        assert not missing, f"missing from task list: {missing}"
+    
+    def test_group_by_assignee(
+        self, generator: TaskListGenerator, tmp_path: Path
+    ) -> None:
         """Test that tasks are grouped by assignee."""
         meeting = Meeting(
             title="Test Meeting",
-            date=datetime(2026, 2, 17),
+            date=_FIXED_DATE,
             action_items=[
                 ActionItem(description="Task 1", assignee="Alice"),
                 ActionItem(description="Task 2", assignee="Bob"),
@@ -427,18 +547,18 @@ class TestTaskListGenerator(unittest.TestCase):
             ]
         )
         
-        output_path = Path(self.temp_dir) / "tasks.md"
-        self.generator.generate(meeting, output_path)
-        content = output_path.read_text()
+        content = self._generate_and_read(generator, meeting, tmp_path)
         
-        self.assertIn("### Alice", content)
-        self.assertIn("### Bob", content)
+        assert "### Alice" in content
+        assert "### Bob" in content
     
-    def test_summary_section(self) -> None:
+    def test_summary_section(
+        self, generator: TaskListGenerator, tmp_path: Path
+    ) -> None:
         """Test that summary section contains correct counts."""
         meeting = Meeting(
             title="Test Meeting",
-            date=datetime(2026, 2, 17),
+            date=_FIXED_DATE,
             action_items=[
                 ActionItem(description="Task 1"),
                 ActionItem(description="Task 2", completed=True),
@@ -447,123 +567,155 @@ class TestTaskListGenerator(unittest.TestCase):
             decisions=[Decision(description="Decision 1")]
         )
         
-        output_path = Path(self.temp_dir) / "tasks.md"
-        self.generator.generate(meeting, output_path)
-        content = output_path.read_text()
+        content = self._generate_and_read(generator, meeting, tmp_path)
         
-        self.assertIn("**Total Action Items:** 3", content)
-        self.assertIn("**Completed:** 2", content)
-        self.assertIn("**Pending:** 1", content)
-        self.assertIn("**Decisions Made:** 1", content)
+        assert "**Total Action Items:** 3" in content
+        assert "**Completed:** 2" in content
+        assert "**Pending:** 1" in content
+        assert "**Decisions Made:** 1" in content
 
 
 # =============================================================================
 # FolderGenerator Tests
 # =============================================================================
 
-class TestFolderGenerator(unittest.TestCase):
+class TestFolderGenerator:
     """Tests for the FolderGenerator class."""
     
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.generator = FolderGenerator()
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture
+    def generator(self) -> FolderGenerator:
+        return FolderGenerator()
     
-    def tearDown(self) -> None:
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture
+    def make_meeting(self) -> Callable[..., Meeting]:
+        """Build a meeting on the fixed date; only the title and attendees vary."""
+        def _make(
+            title: str = "Test Meeting", attendees: Iterable[Attendee] = ()
+        ) -> Meeting:
+            return Meeting(title=title, date=_FIXED_DATE, attendees=list(attendees))
+        return _make
     
-    def test_generate_folder_structure(self) -> None:
+    def test_generate_folder_structure(
+        self,
+        generator: FolderGenerator,
+        make_meeting: Callable[..., Meeting],
+        tmp_path: Path,
+    ) -> None:
         """Test project folder creation."""
-        meeting = Meeting(
-            title="Test Meeting",
-            date=datetime(2026, 2, 17),
-            attendees=[Attendee(name="Alice")]
-        )
+        meeting = make_meeting(attendees=[_ALICE])
         
-        base_path = Path(self.temp_dir)
-        result_path = self.generator.generate(meeting, base_path)
+        result_path = generator.generate(meeting, tmp_path)
         
-        self.assertTrue(result_path.exists())
-        self.assertTrue(result_path.is_dir())
+        assert result_path.exists()
+        assert result_path.is_dir()
         
         # Check default subdirectories
-        self.assertTrue((result_path / "documents").exists())
-        self.assertTrue((result_path / "documents" / "notes").exists())
-        self.assertTrue((result_path / "documents" / "reports").exists())
-        self.assertTrue((result_path / "tasks").exists())
-        self.assertTrue((result_path / "resources").exists())
-        self.assertTrue((result_path / "archive").exists())
-    
-    def test_generate_custom_structure(self) -> None:
+        assert (result_path / "documents").exists()
+        assert (result_path / "documents" / "notes").exists()
+        assert (result_path / "documents" / "reports").exists()
+        assert (result_path / "tasks").exists()
+        assert (result_path / "resources").exists()
+        assert (result_path / "archive").exists()
+    
+    def test_generate_custom_structure(
+        self,
+        generator: FolderGenerator,
+        make_meeting: Callable[..., Meeting],
+        tmp_path: Path,
+    ) -> None:
         """Test custom folder structure."""
-        meeting = Meeting(
-            title="Test Meeting",
-            date=datetime(2026, 2, 17)
-        )
+        meeting = make_meeting()
         
         custom_structure = ["docs", "src", "tests", "assets"]
-        base_path = Path(self.temp_dir)
-        result_path = self.generator.generate(meeting, base_path, custom_structure)
+        result_path = generator.generate(meeting, tmp_path, custom_structure)
         
         for subdir in custom_structure:
-            self.assertTrue((result_path / subdir).exists())
+            assert (result_path / subdir).exists()
     
-    def test_generate_project_readme(self) -> None:
+    def test_custom_structure_nested_entries(
+        self,
+        generator: FolderGenerator,
+        make_meeting: Callable[..., Meeting],
+        tmp_path: Path,
+    ) -> None:
+        """Test nested custom entries create their parents once."""
+        meeting = make_meeting()
+        
+        custom_structure = ["docs", "docs/api", "docs/api/v1", "src"]
+        assert FolderGenerator._leaf_dirs(custom_structure) == ["docs/api/v1", "src"]
+        
+        result_path = generator.generate(meeting, tmp_path, custom_structure)
+        
+        for subdir in custom_structure:
+            assert (result_path / subdir).is_dir()
+    
+    def test_generate_project_readme(
+        self,
+        generator: FolderGenerator,
+        make_meeting: Callable[..., Meeting],
+        tmp_path: Path,
+    ) -> None:
         """Test that project README is generated."""
-        meeting = Meeting(
-            title="Q1 Planning",
-            date=datetime(2026, 2, 17),
-            attendees=[Attendee(name="Alice"), Attendee(name="Bob")]
-        )
+        meeting = make_meeting("Q1 Planning", [_ALICE, _BOB])
         
-        base_path = Path(self.temp_dir)
-        result_path = self.generator.generate(meeting, base_path)
+        result_path = generator.generate(meeting, tmp_path)
         
         readme_path = result_path / "README.md"
-        self.assertTrue(readme_path.exists())
+        assert readme_path.exists()
         
         content = readme_path.read_text()
-        self.assertIn("# Q1 Planning", content)
-        self.assertIn("- Alice", content)
-        self.assertIn("- Bob", content)
-        self.assertIn("## Project Structure", content)
+        assert "# Q1 Planning" in content
+        assert "- Alice" in content
+        assert "- Bob" in content
+        assert "## Project Structure" in content
     
-    def test_sanitize_folder_name(self) -> None:
+    def test_sanitize_folder_name(self, generator: FolderGenerator) -> None:
         """Test folder name sanitization."""
-        meeting = Meeting(
-            title="Meeting: Planning <2026>",
-            date=datetime(2026, 2, 17)
+        folder_name = generator._sanitize_folder_name(
+            "Meeting: Planning <2026>", now=_FIXED_DATE
         )
         
-        base_path = Path(self.temp_dir)
-        result_path = self.generator.generate(meeting, base_path)
-        
         # Folder name should be sanitized
-        folder_name = result_path.name
-        self.assertNotIn(":", folder_name)
-        self.assertNotIn("<", folder_name)
-        self.assertNotIn(">", folder_name)
+        assert folder_name == "20260217_Meeting-_Planning_-2026"
+        assert ":" not in folder_name
+        assert "<" not in folder_name
+        assert ">" not in folder_name
+    
+    def test_injected_now_sets_date_prefix(
+        self,
+        generator: FolderGenerator,
+        make_meeting: Callable[..., Meeting],
+        tmp_path: Path,
+    ) -> None:
+        """Test the folder date prefix comes from the injected timestamp."""
+        meeting = make_meeting("Sync")
+        
+        result_path = generator.generate(
+            meeting, tmp_path, now=datetime(2025, 12, 31, 23, 59)
+        )
+        
+        assert result_path.name == "20251231_Sync"
 
 
 # =============================================================================
 # EmailDraftGenerator Tests
 # =============================================================================
 
-class TestEmailDraftGenerator(unittest.TestCase):
+@pytest.fixture(scope="module")
+def email_gen() -> EmailDraftGenerator:
+    """A stateless email generator shared across the module."""
+    return EmailDraftGenerator()
+
+
+class TestEmailDraftGenerator:
     """Tests for the EmailDraftGenerator class."""
     
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.generator = EmailDraftGenerator()
-    
-    def test_generate_emails(self) -> None:
+    def test_generate_emails(self, email_gen: EmailDraftGenerator) -> None:
         """Test email draft generation."""
         meeting = Meeting(
             title="Q1 Planning",
-            date=datetime(2026, 2, 17),
-            attendees=[Attendee(name="Alice"), Attendee(name="Bob")],
+            date=_FIXED_DATE,
+            attendees=[_ALICE, _BOB],
             action_items=[
                 ActionItem(description="Task 1", assignee="Alice"),
                 ActionItem(description="Task 2", assignee="Bob"),
@@ -571,43 +723,42 @@ class TestEmailDraftGenerator(unittest.TestCase):
             ]
         )
         
-        emails = self.generator.generate(meeting)
+        emails = email_gen.generate(meeting)
         
         # Should have: 1 for Alice, 1 for Bob, 1 summary = 3 total
-        self.assertEqual(len(emails), 3)
+        assert isinstance(emails, EmailDrafts)
+        assert set(emails.per_assignee) == {"Alice", "Bob"}
+        assert emails.summary
+        assert len(emails) == 3
     
-    def test_individual_email_content(self) -> None:
+    def test_individual_email_content(self, email_gen: EmailDraftGenerator) -> None:
         """Test individual assignee email content."""
         meeting = Meeting(
             title="Q1 Planning",
-            date=datetime(2026, 2, 17),
-            attendees=[Attendee(name="Alice")],
+            date=_FIXED_DATE,
+            attendees=[_ALICE],
             action_items=[
-                ActionItem(description="API integration", assignee="Alice", due_date=datetime(2026, 2, 20)),
+                ActionItem(description="API integration", assignee="Alice", due_date=_FIXED_DUE_DATE),
                 ActionItem(description="Documentation", assignee="Alice"),
             ]
         )
         
-        emails = self.generator.generate(meeting)
+        emails = email_gen.generate(meeting)
         
-        # Find Alice's individual email
-        alice_email = None
-        for email in emails:
-            if "Hi Alice," in email and "Action Items from Q1 Planning" in email:
-                alice_email = email
-                break
+        alice_email = emails.per_assignee["Alice"]
         
-        self.assertIsNotNone(alice_email)
-        self.assertIn("API integration", alice_email)
-        self.assertIn("Documentation", alice_email)
-        self.assertIn("Due: February 20, 2026", alice_email)
+        assert "Hi Alice," in alice_email
+        assert "Action Items from Q1 Planning" in alice_email
+        assert "API integration" in alice_email
+        assert "Documentation" in alice_email
+        assert "Due: February 20, 2026" in alice_email
     
-    def test_summary_email_content(self) -> None:
+    def test_summary_email_content(self, email_gen: EmailDraftGenerator) -> None:
         """Test summary email content."""
         meeting = Meeting(
             title="Q1 Planning",
-            date=datetime(2026, 2, 17),
-            attendees=[Attendee(name="Alice"), Attendee(name="Bob")],
+            date=_FIXED_DATE,
+            attendees=[_ALICE, _BOB],
             discussion_points=["Point 1", "Point 2", "Point 3"],
             action_items=[
                 ActionItem(description="Task 1", assignee="Alice"),
@@ -615,99 +766,194 @@ class TestEmailDraftGenerator(unittest.TestCase):
             decisions=[Decision(description="Decision 1")]
         )
         
-        emails = self.generator.generate(meeting)
+        emails = email_gen.generate(meeting)
         
-        # Find summary email
-        summary_email = None
-        for email in emails:
-            if "Meeting Recap" in email:
-                summary_email = email
-                break
+        summary_email = emails.summary
         
-        self.assertIsNotNone(summary_email)
-        self.assertIn("Alice, Bob", summary_email)
-        self.assertIn("Discussion Summary", summary_email)
-        self.assertIn("Key Decisions", summary_email)
-        self.assertIn("Decision 1", summary_email)
+        assert "Meeting Recap" in summary_email
+        assert "Alice, Bob" in summary_email
+        assert "Discussion Summary" in summary_email
+        assert "Key Decisions" in summary_email
+        assert "Decision 1" in summary_email
 
 
 # =============================================================================
 # Integration Tests
 # =============================================================================
 
-class TestMeetingPipeline(unittest.TestCase):
+@pytest.fixture(scope="module")
+def pipeline_result(tmp_path_factory: pytest.TempPathFactory) -> PipelineOutput:
+    """Run the full pipeline on SAMPLE_MEETING_NOTES once per module."""
+    pipeline = MeetingPipeline(output_dir=tmp_path_factory.mktemp("output"))
+    return pipeline.process(SAMPLE_MEETING_NOTES)
+
+
+@pytest.fixture
+def pipeline(tmp_path: Path) -> MeetingPipeline:
+    """A pipeline writing into this test's temporary directory."""
+    return MeetingPipeline(output_dir=tmp_path / "output")
+
+
+class TestMeetingPipeline:
     """Integration tests for the complete pipeline."""
     
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.pipeline = MeetingPipeline(output_dir=Path(self.temp_dir) / "output")
-    
-    def tearDown(self) -> None:
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    def test_full_pipeline(self) -> None:
+    def test_full_pipeline(self, pipeline_result: PipelineOutput) -> None:
         """Test complete pipeline execution."""
-        result = self.pipeline.process(SAMPLE_MEETING_NOTES)
+        result = pipeline_result
         
         # Check meeting was parsed
-        self.assertEqual(result.meeting.title, "Q1 Planning")
-        self.assertEqual(len(result.meeting.attendees), 3)
-        self.assertGreaterEqual(len(result.meeting.action_items), 3)
+        assert result.meeting.title == "Q1 Planning"
+        assert len(result.meeting.attendees) == 3
+        assert len(result.meeting.action_items) >= 3
         
         # Check artifacts were generated
-        self.assertIsNotNone(result.calendar_path)
-        self.assertTrue(result.calendar_path.exists())
+        assert result.calendar_path is not None
+        assert result.calendar_path.exists()
+        
+        assert result.task_list_path is not None
+        assert result.task_list_path.exists()
+        
+        assert result.folder_path is not None
+        assert result.folder_path.exists()
+        
+        assert len(result.email_drafts) >= 3
+    
+    def test_in_memory_pipeline_writes_nothing(
+        self, tmp_path: Path, pipeline_result: PipelineOutput
+    ) -> None:
+        """Test in-memory runs return artifact text and leave the disk alone."""
+        output_dir = tmp_path / "output"
+        result = MeetingPipeline(output_dir=output_dir, in_memory=True).process(
+            SAMPLE_MEETING_NOTES
+        )
+        
+        assert not output_dir.exists()
+        assert result.calendar_path is None
+        assert result.task_list_path is None
+        assert result.folder_path is None
+        
+        assert result.calendar_content is not None
+        assert result.calendar_content.startswith("BEGIN:VCALENDAR")
+        assert "SUMMARY:Q1 Planning" in result.calendar_content
+        
+        # Same task list the on-disk run wrote
+        assert pipeline_result.task_list_path is not None
+        assert result.task_list_content == pipeline_result.task_list_path.read_text()
+        assert len(result.email_drafts) >= 3
+    
+    def test_in_memory_matches_disk_for_custom_generator(self, tmp_path: Path) -> None:
+        """Test a generator's render() override shapes both in-memory and disk output."""
+        class StampedTaskListGenerator(TaskListGenerator):
+            def render(self, meeting: Meeting) -> str:
+                return "<!-- stamped -->\n" + super().render(meeting)
         
-        self.assertIsNotNone(result.task_list_path)
-        self.assertTrue(result.task_list_path.exists())
+        def run(in_memory: bool) -> PipelineOutput:
+            return MeetingPipeline(
+                output_dir=tmp_path / ("memory" if in_memory else "disk"),
+                task_generator=StampedTaskListGenerator(),
+                in_memory=in_memory
+            ).process(MINIMAL_MEETING, generate_calendar=False, generate_folder=False)
         
-        self.assertIsNotNone(result.folder_path)
-        self.assertTrue(result.folder_path.exists())
+        on_disk = run(in_memory=False)
+        in_memory = run(in_memory=True)
         
-        self.assertGreaterEqual(len(result.email_drafts), 3)
+        assert on_disk.task_list_path is not None
+        assert in_memory.task_list_content == on_disk.task_list_path.read_text()
+        assert in_memory.task_list_content.startswith("<!-- stamped -->")
     
-    def test_pipeline_selective_generation(self) -> None:
+    def test_in_memory_custom_generators(self, tmp_path: Path) -> None:
+        """Test in-memory runs honor render() without ``now`` and generate()-only overrides."""
+        class PlainRenderCalendarGenerator(CalendarGenerator):
+            def render(self, meeting: Meeting) -> str:  # type: ignore[override]
+                return "BEGIN:VCALENDAR\nEND:VCALENDAR"
+        
+        class FileOnlyTaskListGenerator(TaskListGenerator):
+            def generate(self, meeting: Meeting, output_path: Path) -> Path:
+                output_path.write_text(f"# {meeting.title} (file only)")
+                return output_path
+        
+        output_dir = tmp_path / "output"
+        result = MeetingPipeline(
+            output_dir=output_dir,
+            calendar_generator=PlainRenderCalendarGenerator(),
+            task_generator=FileOnlyTaskListGenerator(),
+            in_memory=True
+        ).process(MINIMAL_MEETING, generate_folder=False)
+        
+        assert not output_dir.exists()
+        assert result.calendar_content == "BEGIN:VCALENDAR\nEND:VCALENDAR"
+        assert result.task_list_content is not None
+        assert result.task_list_content.endswith("(file only)")
+    
+    def test_pipeline_selective_generation(self, pipeline: MeetingPipeline) -> None:
         """Test pipeline with selective artifact generation."""
-        result = self.pipeline.process(
-            SAMPLE_MEETING_NOTES,
+        result = pipeline.process(
+            MINIMAL_MEETING,
             generate_calendar=False,
             generate_task_list=True,
             generate_folder=False,
             generate_emails=True
         )
         
-        self.assertIsNone(result.calendar_path)
-        self.assertIsNotNone(result.task_list_path)
-        self.assertIsNone(result.folder_path)
-        self.assertGreaterEqual(len(result.email_drafts), 1)
+        assert result.calendar_path is None
+        assert result.task_list_path is not None
+        assert result.folder_path is None
+        assert len(result.email_drafts) >= 1
     
-    def test_pipeline_empty_notes_raises(self) -> None:
+    def test_pipeline_empty_notes_raises(self, pipeline: MeetingPipeline) -> None:
         """Test that empty notes raises ValidationError."""
-        with self.assertRaises(ValidationError):
-            self.pipeline.process("")
+        with pytest.raises(ValidationError):
+            pipeline.process("")
         
-        with self.assertRaises(ValidationError):
-            self.pipeline.process("   \n\n  ")
+        with pytest.raises(ValidationError):
+            pipeline.process("   \n\n  ")
     
-    def test_pipeline_invalid_input_type(self) -> None:
+    def test_pipeline_generator_error_propagates(self, tmp_path: Path) -> None:
+        """Test a failure in a worker-thread generator reaches the caller."""
+        class FailingCalendarGenerator(CalendarGenerator):
+            def generate(self, *args, **kwargs) -> Path:
+                raise CalendarGenerationError("disk full")
+        
+        pipeline = MeetingPipeline(
+            output_dir=tmp_path / "output",
+            calendar_generator=FailingCalendarGenerator()
+        )
+        
+        with pytest.raises(CalendarGenerationError):
+            pipeline.process(MINIMAL_MEETING)
+    
+    def test_pipeline_custom_generators_without_now(self, tmp_path: Path) -> None:
+        """Test injected generators whose generate() has no ``now`` still work."""
+        class PlainCalendarGenerator(CalendarGenerator):
+            def generate(self, meeting: Meeting, output_path: Path) -> Path:  # type: ignore[override]
+                return super().generate(meeting, output_path)
+        
+        class PlainFolderGenerator(FolderGenerator):
+            def generate(self, meeting: Meeting, base_path: Path) -> Path:  # type: ignore[override]
+                return super().generate(meeting, base_path)
+        
+        pipeline = MeetingPipeline(
+            output_dir=tmp_path / "output",
+            calendar_generator=PlainCalendarGenerator(),
+            folder_generator=PlainFolderGenerator()
+        )
+        result = pipeline.process(MINIMAL_MEETING)
+        
+        assert result.calendar_path is not None and result.calendar_path.exists()
+        assert result.folder_path is not None and result.folder_path.is_dir()
+    
+    def test_pipeline_invalid_input_type(self, pipeline: MeetingPipeline) -> None:
         """Test that invalid input types are handled."""
-        with self.assertRaises((ValidationError, MeetingParseError)):
-            self.pipeline.process(None)  # type: ignore
+        with pytest.raises((ValidationError, MeetingParseError)):
+            pipeline.process(None)  # type: ignore
 
 
 # =============================================================================
 # Edge Case Tests
 # =============================================================================
 
-class TestEdgeCases(unittest.TestCase):
-    """Tests for edge cases and error conditions."""
-    
-    def test_meeting_with_no_attendees(self) -> None:
-        """Test parsing meeting without attendees."""
-        notes = """
+_EDGE_CASE_NOTES = {
+    "no_attendees": """
 Meeting: Solo Planning
 Date: Feb 17, 2026
 
@@ -716,49 +962,24 @@ Discussion:
 
 Action Items:
 1. [ ] Task 1
-"""
-        parser = MeetingParser()
-        meeting = parser.parse(notes)
-        
-        self.assertEqual(meeting.title, "Solo Planning")
-        self.assertEqual(len(meeting.attendees), 0)
-    
-    def test_meeting_with_no_action_items(self) -> None:
-        """Test parsing meeting without action items."""
-        notes = """
+""",
+    "no_action_items": """
 Meeting: Informational
 Date: Feb 17, 2026
 Attendees: Alice
 
 Discussion:
 - Status update
-"""
-        parser = MeetingParser()
-        meeting = parser.parse(notes)
-        
-        self.assertEqual(len(meeting.action_items), 0)
-    
-    def test_due_date_without_year(self) -> None:
-        """Test parsing due date without explicit year."""
-        notes = f"""
+""",
+    "due_no_year": """
 Meeting: Test
 Date: Feb 17, 2026
 Attendees: Alice
 
 Action Items:
 1. [ ] Task 1 - Alice - Due Mar 15
-"""
-        parser = MeetingParser(default_year=2026)
-        meeting = parser.parse(notes)
-        
-        task = meeting.action_items[0]
-        self.assertIsNotNone(task.due_date)
-        self.assertEqual(task.due_date.month, 3)
-        self.assertEqual(task.due_date.day, 15)
-    
-    def test_action_item_from_discussion(self) -> None:
-        """Test that implied action items are extracted from discussion."""
-        notes = """
+""",
+    "implied_actions": """
 Meeting: Test
 Date: Feb 17, 2026
 Attendees: Bob
@@ -767,13 +988,99 @@ Discussion:
 - Bob will implement the API
 - Alice to review the design
 - Status is on track
-"""
-        parser = MeetingParser()
-        meeting = parser.parse(notes)
+""",
+}
+
+
+@lru_cache(maxsize=None)
+def _parsed(key: str, default_year: Optional[int] = None) -> Meeting:
+    """Parse one of the edge-case notes once per (key, default_year)."""
+    parser = MeetingParser(default_year=default_year) if default_year else MeetingParser()
+    return parser.parse(_EDGE_CASE_NOTES[key])
+
+
+class TestEdgeCases:
+    """Tests for edge cases and error conditions."""
+    
+    def test_read_notes_file_normalizes_newlines(self, tmp_path: Path) -> None:
+        """Test notes files are decoded as UTF-8 with CRLF line endings normalized."""
+        notes_path = tmp_path / "notes.txt"
+        notes_path.write_bytes("Meeting: Café sync\r\nDate: Feb 17, 2026\r\n".encode("utf-8"))
+        
+        notes = _read_notes_file(str(notes_path))
+        
+        assert notes == "Meeting: Café sync\nDate: Feb 17, 2026\n"
+    
+    def test_read_notes_file_survives_short_reads(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a read that returns fewer bytes than asked doesn't truncate the notes."""
+        notes_path = tmp_path / "notes.txt"
+        notes_path.write_text(SAMPLE_MEETING_NOTES, encoding="utf-8")
+        real_read = os.read
+        monkeypatch.setattr(os, "read", lambda fd, n: real_read(fd, min(n, 7)))
+        
+        assert _read_notes_file(str(notes_path)) == SAMPLE_MEETING_NOTES
+    
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["notes.txt"],
+            ["-"],
+            ["notes.txt", "-o", "out"],
+            ["--output", "out", "notes.txt", "--no-tasks"],
+            ["--output=out", "--no-calendar", "--no-folder", "--no-emails", "notes.txt"],
+            ["notes.txt", "--no-cal"],
+            ["-oout", "notes.txt"],
+        ],
+    )
+    def test_cli_args_match_argparse(self, argv: list[str]) -> None:
+        """Test the fast CLI parser agrees with the argparse definition."""
+        expected = vars(_build_arg_parser().parse_args(argv))
+        assert _parse_cli_args(argv) == expected
+    
+    def test_format_date_distinguishes_time_zones(self) -> None:
+        """Test equal instants in different zones keep their own calendar day."""
+        utc = datetime(2026, 2, 18, 2, 0, tzinfo=timezone.utc)
+        local = utc.astimezone(timezone(timedelta(hours=-5)))
+        
+        assert _format_date(utc, "%b %d") == "Feb 18"
+        assert _format_date(local, "%b %d") == "Feb 17"
+    
+    def test_meeting_with_no_attendees(self) -> None:
+        """Test parsing meeting without attendees."""
+        meeting = _parsed("no_attendees")
+        
+        assert meeting.title == "Solo Planning"
+        assert len(meeting.attendees) == 0
+    
+    def test_meeting_with_no_action_items(self) -> None:
+        """Test parsing meeting without action items."""
+        meeting = _parsed("no_action_items")
+        
+        assert len(meeting.action_items) == 0
+    
+    def test_due_date_without_year(self) -> None:
+        """Test parsing due date without explicit year."""
+        meeting = _parsed("due_no_year", default_year=2026)
+        
+        task = meeting.action_items[0]
+        assert task.due_date is not None
+        assert task.due_date.month == 3
+        assert task.due_date.day == 15
+    
+    def test_cached_date_respects_default_year(self) -> None:
+        """Test cached date parses are keyed by the parser's default year."""
+        assert MeetingParser(default_year=2026)._parse_date("Mar 15").year == 2026
+        assert MeetingParser(default_year=2027)._parse_date("Mar 15").year == 2027
+    
+    def test_action_item_from_discussion(self) -> None:
+        """Test that implied action items are extracted from discussion."""
+        meeting = _parsed("implied_actions")
         
         # Should extract implied action items
         bob_items = [i for i in meeting.action_items if i.assignee == "Bob"]
-        self.assertGreaterEqual(len(bob_items), 1)
+        assert len(bob_items) >= 1
 
 
 # =============================================================================
@@ -781,4 +1088,5 @@ Discussion:
 # =============================================================================
 
 if __name__ == "__main__":
-    unittest.main(verbosity=2)
\ No newline at end of file
+    # Run through pytest so fixture-based tests are collected too
+    raise SystemExit(pytest.main([__file__, "-v"]))
\ No newline at end of file
@@ -7,13 +7,27 @@ Tests follow Python best practices:
 - Clean test structure
 """
 
-import tempfile
+import json
+import os
 from datetime import datetime
 from pathlib import Path
+from typing import Iterable
 
 import pytest
 
-from organizer import FileInfo, FileOrganizer, OrganizeResult
+from linux_optimized import StatxResult, statx, statx_available
+from organizer import (
+    FileInfo,
+    FileOrganizer,
+    OrganizeResult,
+    dump_report,
+)
+
+
+def _mkfiles(root: Path, names: Iterable[str]) -> None:
+    """Create empty files under root with one open/close each (touch adds a utime)."""
+    for name in names:
+        os.close(os.open(root / name, os.O_CREAT | os.O_WRONLY))
 
 
 class TestFileInfo:
@@ -21,8 +35,8 @@ class TestFileInfo:
 
     def test_file_info_creation(self, tmp_path: Path) -> None:
         """Test FileInfo is created with correct attributes."""
+        _mkfiles(tmp_path, ["test.py"])
         test_file = tmp_path / "test.py"
-        test_file.touch()
 
         info = FileInfo(
             source_path=test_file,
@@ -36,8 +50,8 @@ class TestFileInfo:
 
     def test_suggested_name_generation(self, tmp_path: Path) -> None:
         """Test suggested name is generated for generic filenames."""
+        _mkfiles(tmp_path, ["IMG_1234.png"])
         test_file = tmp_path / "IMG_1234.png"
-        test_file.touch()
 
         info = FileInfo(
             source_path=test_file,
@@ -49,8 +63,8 @@ class TestFileInfo:
 
     def test_suggested_name_preserved(self, tmp_path: Path) -> None:
         """Test meaningful names are preserved."""
+        _mkfiles(tmp_path, ["my_project.py"])
         test_file = tmp_path / "my_project.py"
-        test_file.touch()
 
         info = FileInfo(
             source_path=test_file,
@@ -61,6 +75,12 @@ class TestFileInfo:
         assert info.suggested_name == "my_project.py"
 
 
+@pytest.fixture(scope="module")
+def organizer(tmp_path_factory: pytest.TempPathFactory) -> FileOrganizer:
+    """One organizer for pure lookup tests; they never touch its folder."""
+    return FileOrganizer(tmp_path_factory.mktemp("categories"))
+
+
 class TestFileOrganizer:
     """Tests for FileOrganizer class."""
 
@@ -77,49 +97,72 @@ class TestFileOrganizer:
         with pytest.raises(ValueError, match="not a directory"):
             FileOrganizer(test_file)
 
-    def test_get_category_images(self, tmp_path: Path) -> None:
-        """Test category detection for images."""
-        organizer = FileOrganizer(tmp_path)
-
-        assert organizer._get_category(Path("test.png")) == "Images"
-        assert organizer._get_category(Path("test.jpg")) == "Images"
-        assert organizer._get_category(Path("test.JPEG")) == "Images"
-
-    def test_get_category_code(self, tmp_path: Path) -> None:
-        """Test category detection for code files."""
-        organizer = FileOrganizer(tmp_path)
-
-        assert organizer._get_category(Path("test.py")) == "Code"
-        assert organizer._get_category(Path("test.js")) == "Code"
-        assert organizer._get_category(Path("test.ts")) == "Code"
-
-    def test_get_category_misc(self, tmp_path: Path) -> None:
-        """Test unknown extensions go to Misc."""
-        organizer = FileOrganizer(tmp_path)
+    def test_organizer_validates_stat_threads(self, tmp_path: Path) -> None:
+        """Test organizer rejects a non-positive stat thread count."""
+        with pytest.raises(ValueError, match="stat_threads"):
+            FileOrganizer(tmp_path, stat_threads=0)
+
+    @pytest.mark.parametrize(
+        ("name", "category"),
+        [
+            ("test.png", "Images"),
+            ("test.jpg", "Images"),
+            ("test.JPEG", "Images"),
+            ("test.py", "Code"),
+            ("test.js", "Code"),
+            ("test.ts", "Code"),
+            ("test.xyz", "Misc"),
+            ("test.unknown", "Misc"),
+        ],
+    )
+    def test_get_category(
+        self, organizer: FileOrganizer, name: str, category: str
+    ) -> None:
+        """Test category detection by extension, with unknown ones in Misc."""
+        assert organizer._get_category(Path(name)) == category
+
+    @pytest.mark.parametrize(
+        ("birthtime", "expected"),
+        [
+            (datetime(2023, 1, 15).timestamp(), datetime(2023, 1, 15)),
+            (None, datetime(2024, 6, 1)),
+        ],
+    )
+    def test_creation_date_prefers_birth_time(
+        self, organizer: FileOrganizer, birthtime: float | None, expected: datetime
+    ) -> None:
+        """Test birth time wins when known, else modification time is used."""
+        mtime = datetime(2024, 6, 1).timestamp()
+        st = StatxResult(
+            st_mode=0o100644,
+            st_ino=1,
+            st_size=0,
+            st_mtime=mtime,
+            st_mtime_ns=int(mtime * 1e9),
+            st_birthtime=birthtime,
+        )
 
-        assert organizer._get_category(Path("test.xyz")) == "Misc"
-        assert organizer._get_category(Path("test.unknown")) == "Misc"
+        assert organizer._get_creation_date(st) == expected
 
     def test_scan_files_skips_hidden(self, tmp_path: Path) -> None:
         """Test hidden files are skipped."""
         # Create files
-        (tmp_path / ".hidden").touch()
-        (tmp_path / "visible.txt").touch()
+        _mkfiles(tmp_path, [".hidden", "visible.txt"])
 
         organizer = FileOrganizer(tmp_path)
         files = organizer.scan_files()
 
         assert len(files) == 1
-        assert all(".hidden" not in str(f.source_path) for f in files)
+        assert all(not f.source_path.name.startswith(".") for f in files)
 
     def test_scan_files_skips_category_folders(self, tmp_path: Path) -> None:
         """Test files in category folders are skipped."""
         # Create category folder with file
         (tmp_path / "Images").mkdir()
-        (tmp_path / "Images" / "existing.png").touch()
+        _mkfiles(tmp_path, ["Images/existing.png"])
 
         # Create file in root
-        (tmp_path / "new.png").touch()
+        _mkfiles(tmp_path, ["new.png"])
 
         organizer = FileOrganizer(tmp_path)
         files = organizer.scan_files()
@@ -127,6 +170,56 @@ class TestFileOrganizer:
         assert len(files) == 1
         assert files[0].source_path.name == "new.png"
 
+    def test_scan_files_skips_unreadable_folder(self, tmp_path: Path) -> None:
+        """Test an unreadable subfolder is reported without aborting the scan."""
+        locked = tmp_path / "locked"
+        locked.mkdir()
+        _mkfiles(tmp_path, ["locked/secret.txt", "photo.png"])
+        locked.chmod(0)
+        try:
+            if os.access(locked, os.R_OK):
+                pytest.skip("permissions are not enforced for this user")
+
+            organizer = FileOrganizer(tmp_path)
+            files = organizer.scan_files()
+        finally:
+            locked.chmod(0o755)
+
+        assert [f.source_path.name for f in files] == ["photo.png"]
+        assert [path.name for path, _ in organizer.result.errors] == ["locked"]
+
+    def test_scan_files_skips_symlinks(self, tmp_path: Path) -> None:
+        """Test symlinks are not organized."""
+        _mkfiles(tmp_path, ["real.txt"])
+        (tmp_path / "link.txt").symlink_to(tmp_path / "real.txt")
+
+        organizer = FileOrganizer(tmp_path)
+        files = organizer.scan_files()
+
+        assert [f.source_path.name for f in files] == ["real.txt"]
+
+    def test_duplicate_names_get_distinct_targets(self, tmp_path: Path) -> None:
+        """Test files with the same name in different folders don't collide."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        _mkfiles(tmp_path, ["a/notes.txt", "b/notes.txt"])
+
+        organizer = FileOrganizer(tmp_path, organize_by_date=False)
+        files = organizer.scan_files()
+
+        targets = {f.target_path.name for f in files}
+        assert targets == {"notes.txt", "notes_1.txt"}
+
+    def test_existing_target_gets_suffix(self, tmp_path: Path) -> None:
+        """Test files already in the target folder are not overwritten."""
+        (tmp_path / "Documents").mkdir()
+        _mkfiles(tmp_path, ["Documents/notes.txt", "notes.txt"])
+
+        organizer = FileOrganizer(tmp_path, organize_by_date=False)
+        files = organizer.scan_files()
+
+        assert files[0].target_path == tmp_path / "Documents" / "notes_1.txt"
+
 
 class TestOrganizeResult:
     """Tests for OrganizeResult dataclass."""
@@ -157,52 +250,127 @@ class TestOrganizeResult:
         assert result.all_succeeded is False
 
 
+@pytest.mark.skipif(not statx_available(), reason="statx() not available")
+class TestStatx:
+    """Tests for the Linux statx() fast path."""
+
+    def test_matches_os_stat(self, tmp_path: Path) -> None:
+        """Test statx reports the same type and mtime as os.stat."""
+        test_file = tmp_path / "file.txt"
+        test_file.write_text("test")
+
+        result = statx(test_file)
+        expected = os.stat(test_file)
+
+        assert result.st_mode == expected.st_mode
+        assert result.st_ino == expected.st_ino
+        assert result.st_size == expected.st_size
+        assert result.st_mtime_ns == expected.st_mtime_ns
+        assert result.st_mtime == pytest.approx(expected.st_mtime)
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        """Test statx raises FileNotFoundError for missing paths."""
+        with pytest.raises(FileNotFoundError):
+            statx(tmp_path / "missing.txt")
+
+
+@pytest.fixture(scope="module")
+def organized(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[FileOrganizer, list[FileInfo], OrganizeResult]:
+    """Scan and dry-run organize three files once; tests only read the outcome."""
+    root = tmp_path_factory.mktemp("organized")
+    _mkfiles(root, ["photo.png", "script.py", "doc.pdf"])
+
+    organizer = FileOrganizer(root, dry_run=True)
+    files = organizer.scan_files()
+    result = organizer.organize(files)
+    return organizer, files, result
+
+
 class TestIntegration:
     """Integration tests for full workflow."""
 
-    def test_full_organize_workflow(self, tmp_path: Path) -> None:
+    def test_full_organize_workflow(
+        self, organized: tuple[FileOrganizer, list[FileInfo], OrganizeResult]
+    ) -> None:
         """Test complete organization workflow."""
-        # Create test files
-        (tmp_path / "photo.png").touch()
-        (tmp_path / "script.py").touch()
-        (tmp_path / "doc.pdf").touch()
-
-        organizer = FileOrganizer(tmp_path, dry_run=True)
-        files = organizer.scan_files()
+        _, files, result = organized
 
         assert len(files) == 3
-
-        result = organizer.organize(files)
         assert result.success_count == 3
 
-    def test_dry_run_does_not_move(self, tmp_path: Path) -> None:
+    def test_dry_run_does_not_move(
+        self, organized: tuple[FileOrganizer, list[FileInfo], OrganizeResult]
+    ) -> None:
         """Test dry run does not actually move files."""
-        # Create test file
-        test_file = tmp_path / "photo.png"
-        test_file.touch()
+        organizer, files, _ = organized
 
-        organizer = FileOrganizer(tmp_path, dry_run=True)
-        files = organizer.scan_files()
-        organizer.organize(files)
+        # Files should still be in their original location
+        assert (organizer.source_folder / "photo.png").exists()
+        assert all(f.source_path.exists() for f in files)
 
-        # File should still be in original location
-        assert test_file.exists()
+    def test_scan_and_organize_moves_files(self, tmp_path: Path) -> None:
+        """Test single-pass scan and organize moves files."""
+        _mkfiles(tmp_path, ["photo.png", "script.py"])
 
-    def test_generate_report(self, tmp_path: Path) -> None:
-        """Test report generation."""
-        (tmp_path / "photo.png").touch()
-        (tmp_path / "script.py").touch()
+        organizer = FileOrganizer(tmp_path, dry_run=False, organize_by_date=False)
+        result = organizer.scan_and_organize()
 
+        assert result.success_count == 2
+        assert (tmp_path / "Images" / "photo.png").exists()
+        assert (tmp_path / "Code" / "script.py").exists()
+
+    def test_generate_report(self, tmp_path: Path) -> None:
+        """Test report generation from prebuilt file info (no real files)."""
         organizer = FileOrganizer(tmp_path, dry_run=True)
-        files = organizer.scan_files()
+        root = organizer.source_folder
+        created = datetime(2024, 1, 1)
+        files = [
+            FileInfo(root / name, category, created, target_path=root / category / name)
+            for name, category in [("photo.png", "Images"), ("script.py", "Code")]
+        ]
         organizer.organize(files)
 
         report = organizer.generate_report()
 
         assert report["mode"] == "DRY RUN"
         assert report["files_organized"] == 2
-        assert "Images" in report["by_category"]
-        assert "Code" in report["by_category"]
+        assert report["by_category"] == {"Images": 1, "Code": 1}
+        assert {f["original"] for f in report["organized_files"]} == {
+            "photo.png",
+            "script.py",
+        }
+        assert {f["new"] for f in report["organized_files"]} == {
+            os.path.join("Images", "photo.png"),
+            os.path.join("Code", "script.py"),
+        }
+
+    def test_dump_report_round_trips(self, tmp_path: Path) -> None:
+        """Test the serialized report parses back to the same dict."""
+        _mkfiles(tmp_path, ["photo.png"])
+
+        organizer = FileOrganizer(tmp_path, dry_run=True)
+        organizer.organize(organizer.scan_files())
+        report = organizer.generate_report()
+
+        assert json.loads(dump_report(report)) == report
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_dump_report_non_utf8_name(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, has_orjson: bool
+    ) -> None:
+        """Test names that aren't valid UTF-8 still serialize, with or without orjson."""
+        monkeypatch.setattr("organizer.HAS_ORJSON", has_orjson)
+        raw_name = os.path.join(os.fsencode(tmp_path), b"caf\xe9.txt")
+        os.close(os.open(raw_name, os.O_CREAT | os.O_WRONLY))
+
+        organizer = FileOrganizer(tmp_path, dry_run=True)
+        organizer.organize(organizer.scan_files())
+        report = organizer.generate_report()
+
+        assert report["organized_files"][0]["original"] == os.fsdecode(b"caf\xe9.txt")
+        assert json.loads(dump_report(report)) == report
 
 
 if __name__ == "__main__":